@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""
+fake_provider.py - LLM provider with canned responses for tests
+
+Shared by the tests that need summaries without an API key or network access.
+"""
+
+from tldr.llm_providers import LLMProvider, LLMResponse
+
+
+class FakeProvider(LLMProvider):
+    """Provider that answers batched requests with a canned response and records every call"""
+
+    def __init__(self, batch_response: str = ''):
+        super().__init__(api_key='test-key')
+        self.batch_response = batch_response
+        self.batch_calls = 0
+        self.single_calls = []
+
+    def get_default_model(self) -> str:
+        return 'fake-model'
+
+    def generate_summary(self, file_path: str, file_content: str, signatures: str) -> LLMResponse:
+        self.single_calls.append(file_path)
+        return LLMResponse(content=f' single summary of {file_path} ')
+
+    def _make_api_call(self, prompt: str, max_tokens: int) -> LLMResponse:
+        self.batch_calls += 1
+        return LLMResponse(content=self.batch_response)
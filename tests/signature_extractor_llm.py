@@ -13,13 +13,100 @@ Usage:
     signatures = extractor.get_signatures('path/to/file.py')
 """
 
+import asyncio
 import logging
+import mmap
 import os
-from typing import Optional
+import re
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
 from pygments_tldr.lexers import get_lexer_for_filename
 from pygments_tldr.util import ClassNotFound
 from tldr.llm_providers import LLMFactory, LLMConfig
 
+# Files larger than this are decoded straight from a memory map instead of a buffered read
+MMAP_THRESHOLD_BYTES = 1_000_000
+
+# Files longer than this (in characters) are sent to the LLM in line-aligned chunks
+MAX_PROMPT_CONTENT_CHARS = 200_000
+
+# Common signature prefixes (keywords followed by a space, or decorators/annotations)
+_SIGNATURE_PREFIX_RE = re.compile(
+    r'(?:class|def|function|public|private|protected|static|abstract|'
+    r'interface|enum|const|var|let|type) |@',
+    re.IGNORECASE
+)
+
+# Preamble lines LLMs commonly put before the signature list (compared lowercased)
+_RESPONSE_PREAMBLE_PREFIXES = ('here are', 'the following', 'extracted signatures')
+_PREAMBLE_CHECK_LEN = max(len(prefix) for prefix in _RESPONSE_PREAMBLE_PREFIXES)
+
+# Markdown emphasis markers left over in LLM output
+_MARKDOWN_EMPHASIS_RE = re.compile(r'\*+')
+
+# Languages for common extensions, checked before asking pygments
+_EXT_LANGUAGE_MAP = {
+    '.py': 'python',
+    '.java': 'java',
+    '.js': 'javascript',
+    '.ts': 'typescript',
+    '.cpp': 'cpp',
+    '.c': 'c',
+    '.h': 'c',
+    '.cs': 'csharp',
+    '.rb': 'ruby',
+    '.go': 'go',
+    '.rs': 'rust',
+    '.php': 'php',
+    '.swift': 'swift',
+    '.kt': 'kotlin',
+    '.scala': 'scala'
+}
+
+
+@lru_cache(maxsize=256)
+def _detect_language_by_ext(ext: str) -> str:
+    """
+    Detect the programming language for a file extension (memoized)
+    
+    Args:
+        ext (str): Lowercased file extension, or the file name if it has none
+        
+    Returns:
+        str: Detected language name
+    """
+    language = _EXT_LANGUAGE_MAP.get(ext)
+    if language:
+        return language
+    
+    try:
+        lexer = get_lexer_for_filename('x' + ext if ext.startswith('.') else ext)
+        if hasattr(lexer, 'aliases') and lexer.aliases:
+            return lexer.aliases[0]
+        else:
+            return lexer.__class__.__name__.replace('Lexer', '').lower()
+    except ClassNotFound:
+        return 'unknown'
+
+
+@lru_cache(maxsize=None)
+def _get_provider(provider_name: str):
+    """
+    Create the LLM provider for provider_name once per process.
+
+    Every SignatureExtractorLLM using the same provider shares one client
+    (and its connection pool) instead of re-reading the environment and
+    building a new client per instance.
+    """
+    config = LLMConfig.from_env(provider_name)
+    return LLMFactory.create_provider(
+        provider_name=config.provider,
+        api_key=config.api_key,
+        model=config.model
+    )
+
 
 class SignatureExtractorLLM:
     """LLM-based signature extractor using Claude"""
@@ -37,12 +124,7 @@ class SignatureExtractorLLM:
     def _setup_llm_provider(self, provider_name: str):
         """Setup LLM provider for signature extraction"""
         try:
-            config = LLMConfig.from_env(provider_name)
-            self.llm_provider = LLMFactory.create_provider(
-                provider_name=config.provider,
-                api_key=config.api_key,
-                model=config.model
-            )
+            self.llm_provider = _get_provider(provider_name)
             logging.info(f"LLM signature extractor initialized with '{provider_name}' provider")
         except Exception as e:
             logging.error(f"Failed to initialize LLM provider '{provider_name}': {e}")
@@ -63,32 +145,25 @@ class SignatureExtractorLLM:
             FileNotFoundError: If the file doesn't exist
             Exception: If LLM provider is not available or API call fails
         """
-        # Check if file exists
-        if not os.path.exists(filename):
-            logging.error(f"Error: File '{filename}' not found.")
-            raise FileNotFoundError(f"File '{filename}' does not exist.")
-        
-        if not self.llm_provider:
-            raise Exception("LLM provider not available. Please set ANTHROPIC_API_KEY or OPENAI_API_KEY environment variable.")
+        self._check_can_extract(filename)
         
         try:
-            # Read the file content
-            with open(filename, 'r', encoding='utf-8') as f:
-                file_content = f.read()
-            
-            # Detect the programming language
-            language = self._detect_language(filename)
+            language, chunks = self._prepare_content_chunks(filename)
             
-            # Create the extraction prompt
-            prompt = self._build_signature_extraction_prompt(filename, file_content, language)
-            logging.debug(f"Generated prompt for {filename}:\n{prompt}")
+            chunk_signatures = []
+            for chunk in chunks:
+                # Create the extraction prompt
+                prompt = self._build_signature_extraction_prompt(filename, chunk, language)
+                logging.debug(f"Generated prompt for {filename}:\n{prompt}")
 
-            # Get LLM response
-            response = self.llm_provider._make_api_call(prompt, max_tokens=2000)
-            logging.debug(f"LLM response for {filename}:\n{response.content}")
+                # Get LLM response
+                response = self.llm_provider._make_api_call(prompt, max_tokens=2000)
+                logging.debug(f"LLM response for {filename}:\n{response.content}")
 
-            # Extract and clean the signatures from the response
-            signatures = self._parse_llm_response(response.content)
+                # Extract and clean the signatures from the response
+                chunk_signatures.append(self._parse_llm_response(response.content))
+            
+            signatures = '\n'.join(sig for sig in chunk_signatures if sig)
             
             logging.debug(f"LLM extracted signatures from {filename}:\n{signatures}")
             return signatures
@@ -97,6 +172,159 @@ class SignatureExtractorLLM:
             logging.error(f"Error processing file {filename}: {e}")
             raise
     
+    def get_signatures_stream(self, filename: str) -> Iterator[str]:
+        """
+        Extract signatures from the provided file, yielding each one as soon as the
+        LLM has streamed its line, so parsing overlaps with the network transfer.
+        
+        Args:
+            filename (str): Path to the file to analyze
+            
+        Yields:
+            str: One cleaned signature per line of the LLM response
+            
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+            Exception: If LLM provider is not available or API call fails
+        """
+        self._check_can_extract(filename)
+        
+        try:
+            language, chunks = self._prepare_content_chunks(filename)
+            
+            for chunk in chunks:
+                prompt = self._build_signature_extraction_prompt(filename, chunk, language)
+                logging.debug(f"Generated prompt for {filename}:\n{prompt}")
+                
+                response_lines = self.llm_provider._stream_lines(prompt, max_tokens=2000)
+                for line in self._iter_signature_lines(response_lines):
+                    signature = _MARKDOWN_EMPHASIS_RE.sub('', line).strip()
+                    if signature:
+                        yield signature
+            
+        except Exception as e:
+            logging.error(f"Error processing file {filename}: {e}")
+            raise
+    
+    async def get_signatures_batch(self, filenames: List[str],
+                                   concurrency: int = 8) -> List[Union[str, Exception]]:
+        """
+        Extract signatures from many files concurrently.
+        
+        Each file is still handled by get_signatures() on a worker thread, so the
+        LLM round-trips overlap while at most `concurrency` requests are in flight.
+        
+        Args:
+            filenames (List[str]): Paths of the files to analyze
+            concurrency (int): Maximum number of concurrent LLM calls
+            
+        Returns:
+            List[Union[str, Exception]]: Signatures for each file, in input order.
+                Files that failed are returned as the raised exception.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        loop = asyncio.get_running_loop()
+        
+        async def extract_one(filename: str) -> str:
+            async with semaphore:
+                return await loop.run_in_executor(None, self.get_signatures, filename)
+        
+        return await asyncio.gather(*(extract_one(f) for f in filenames), return_exceptions=True)
+    
+    def _check_can_extract(self, filename: str):
+        """
+        Raise if the file is missing or no LLM provider is configured
+        
+        Args:
+            filename (str): Path to the file to analyze
+        """
+        # Check if file exists
+        if not os.path.exists(filename):
+            logging.error(f"Error: File '{filename}' not found.")
+            raise FileNotFoundError(f"File '{filename}' does not exist.")
+        
+        if not self.llm_provider:
+            raise Exception("LLM provider not available. Please set ANTHROPIC_API_KEY or OPENAI_API_KEY environment variable.")
+    
+    def _prepare_content_chunks(self, filename: str) -> Tuple[str, List[str]]:
+        """
+        Detect the language and read the file into prompt-sized chunks
+        
+        Args:
+            filename (str): Path to the file to analyze
+            
+        Returns:
+            Tuple[str, List[str]]: Detected language and content chunks. The chunk list
+                is empty when there is nothing to ask the LLM (unknown language or empty file).
+        """
+        # Detect the programming language, nothing to ask the LLM about if unknown
+        language = self._detect_language(filename)
+        if language == 'unknown':
+            logging.debug(f"Skipping {filename}: unknown language")
+            return language, []
+        
+        # Read the file content
+        file_content = self._read_file_content(filename)
+        if not file_content.strip():
+            logging.debug(f"Skipping {filename}: file is empty")
+            return language, []
+        
+        return language, self._split_content(file_content)
+    
+    def _read_file_content(self, filename: str) -> str:
+        """
+        Read a source file as UTF-8 text
+        
+        Files above MMAP_THRESHOLD_BYTES are memory-mapped and decoded directly
+        from the mapping, so the raw bytes are never copied into a Python object.
+        Line endings are normalized to '\n' on both paths, as read_text does.
+        
+        Args:
+            filename (str): Path to the file
+            
+        Returns:
+            str: Content of the file
+        """
+        if os.path.getsize(filename) <= MMAP_THRESHOLD_BYTES:
+            return Path(filename).read_text(encoding='utf-8')
+        
+        with open(filename, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    content = str(view, 'utf-8')
+        
+        # Same universal-newline translation read_text applies to smaller files
+        return content.replace('\r\n', '\n').replace('\r', '\n')
+    
+    def _split_content(self, file_content: str) -> List[str]:
+        """
+        Split file content into line-aligned chunks of at most MAX_PROMPT_CONTENT_CHARS
+        
+        A single line longer than the limit becomes a chunk on its own.
+        
+        Args:
+            file_content (str): Content of the file
+            
+        Returns:
+            List[str]: Chunks to send to the LLM, in file order
+        """
+        if len(file_content) <= MAX_PROMPT_CONTENT_CHARS:
+            return [file_content]
+        
+        chunks = []
+        current = []
+        current_len = 0
+        for line in file_content.splitlines(keepends=True):
+            if current and current_len + len(line) > MAX_PROMPT_CONTENT_CHARS:
+                chunks.append(''.join(current))
+                current = []
+                current_len = 0
+            current.append(line)
+            current_len += len(line)
+        if current:
+            chunks.append(''.join(current))
+        return chunks
+    
     def _detect_language(self, filename: str) -> str:
         """
         Detect the programming language of the file
@@ -107,33 +335,8 @@ class SignatureExtractorLLM:
         Returns:
             str: Detected language name
         """
-        try:
-            lexer = get_lexer_for_filename(filename)
-            if hasattr(lexer, 'aliases') and lexer.aliases:
-                return lexer.aliases[0]
-            else:
-                return lexer.__class__.__name__.replace('Lexer', '').lower()
-        except ClassNotFound:
-            # Try to guess from file extension
-            ext = os.path.splitext(filename)[1].lower()
-            ext_map = {
-                '.py': 'python',
-                '.java': 'java',
-                '.js': 'javascript',
-                '.ts': 'typescript',
-                '.cpp': 'cpp',
-                '.c': 'c',
-                '.h': 'c',
-                '.cs': 'csharp',
-                '.rb': 'ruby',
-                '.go': 'go',
-                '.rs': 'rust',
-                '.php': 'php',
-                '.swift': 'swift',
-                '.kt': 'kotlin',
-                '.scala': 'scala'
-            }
-            return ext_map.get(ext, 'unknown')
+        ext = os.path.splitext(filename)[1].lower()
+        return _detect_language_by_ext(ext or os.path.basename(filename))
     
     def _build_signature_extraction_prompt(self, filename: str, file_content: str, language: str) -> str:
         """
@@ -192,8 +395,24 @@ EXTRACTED SIGNATURES:"""
         Returns:
             str: Cleaned signatures text
         """
-        lines = response_content.strip().split('\n')
-        signature_lines = []
+        # Join and clean up the result
+        result = '\n'.join(self._iter_signature_lines(response_content.splitlines()))
+        
+        # Remove any remaining markdown formatting
+        result = _MARKDOWN_EMPHASIS_RE.sub('', result)
+        
+        return result.strip()
+    
+    def _iter_signature_lines(self, lines: Iterable[str]) -> Iterator[str]:
+        """
+        Filter raw LLM response lines down to the signature lines
+        
+        Args:
+            lines (Iterable[str]): Response lines, possibly still arriving from a stream
+            
+        Yields:
+            str: Stripped signature lines (markdown emphasis not yet removed)
+        """
         in_code_block = False
         
         for line in lines:
@@ -202,7 +421,7 @@ EXTRACTED SIGNATURES:"""
             # Skip empty lines and common response prefixes
             if not line:
                 continue
-            if line.lower().startswith(('here are', 'the following', 'extracted signatures')):
+            if line[:_PREAMBLE_CHECK_LEN].lower().startswith(_RESPONSE_PREAMBLE_PREFIXES):
                 continue
             
             # Handle code blocks
@@ -212,51 +431,21 @@ EXTRACTED SIGNATURES:"""
             
             # If we're in a code block or line looks like a signature, include it
             if in_code_block or self._looks_like_signature(line):
-                signature_lines.append(line)
-        
-        # Join and clean up the result
-        result = '\n'.join(signature_lines)
-        
-        # Remove any remaining markdown formatting
-        result = result.replace('**', '').replace('*', '')
-        
-        return result.strip()
+                yield line
     
     def _looks_like_signature(self, line: str) -> bool:
         """
         Check if a line looks like a code signature
         
         Args:
-            line (str): Line to check
+            line (str): Line to check, already stripped
             
         Returns:
             bool: True if line appears to be a signature
         """
-        line = line.strip()
-        
-        # Common signature patterns
-        signature_patterns = [
-            'class ',
-            'def ',
-            'function ',
-            'public ',
-            'private ',
-            'protected ',
-            'static ',
-            'abstract ',
-            'interface ',
-            'enum ',
-            'const ',
-            'var ',
-            'let ',
-            'type ',
-            '@',  # decorators/annotations
-        ]
-        
         # Check if line starts with any signature pattern
-        for pattern in signature_patterns:
-            if line.lower().startswith(pattern.lower()):
-                return True
+        if _SIGNATURE_PREFIX_RE.match(line):
+            return True
         
         # Check for method-like patterns (contains parentheses)
         if '(' in line and ')' in line:
@@ -274,10 +463,13 @@ if __name__ == '__main__':
     def main():
         """
         Main function to test LLM signature extraction
+        Usage: python signature_extractor_llm.py <filename>
         """
-        # Test file path
-        # filename = "/Users/csimoes/Projects/Python/tldr/tldr/llm_providers/claude_provider.py"
-        filename = "/Users/csimoes/IdeaProjects/Amazon/AmazonScraper/adtrimmer-webapp/src/main/java/org/simoes"
+        if len(sys.argv) < 2:
+            print("Usage: python signature_extractor_llm.py <filename>")
+            return
+        
+        filename = sys.argv[1]
 
         try:
             extractor = SignatureExtractorLLM()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+test_llm_provider.py - Tests for the batched summary support in LLMProvider and provider construction
+
+Uses a fake provider with canned responses, so no API key or network access is needed.
+"""
+
+import json
+import pytest
+
+from tests.fake_provider import FakeProvider
+
+
+ITEMS = [
+    ('src/a.py', 'def a(): pass', 'def a()'),
+    ('src/b.py', 'def b(): pass', 'def b()'),
+]
+
+SUMMARIES = {'src/a.py': 'Defines a.', 'src/b.py': 'Defines b.'}
+
+
+class TestParseBatchSummaries:
+    """Parsing of the JSON object in a batched summary response"""
+
+    def parse(self, text: str) -> dict:
+        return FakeProvider()._parse_batch_summaries(text)
+
+    def test_plain_object(self):
+        assert self.parse(json.dumps(SUMMARIES)) == SUMMARIES
+
+    def test_code_fence(self):
+        assert self.parse(f"```json\n{json.dumps(SUMMARIES, indent=2)}\n```") == SUMMARIES
+
+    def test_braces_in_trailing_prose(self):
+        assert self.parse(f"{json.dumps(SUMMARIES)}\nthanks {{x}}") == SUMMARIES
+
+    def test_braces_in_leading_prose(self):
+        assert self.parse(f"Summaries for {{2}} files:\n{json.dumps(SUMMARIES)}") == SUMMARIES
+
+    def test_braces_inside_summaries(self):
+        summaries = {'src/a.py': 'Formats {name} placeholders.'}
+        assert self.parse(f"Here you go: {json.dumps(summaries)} Done.") == summaries
+
+    @pytest.mark.parametrize('text', ['', 'no json here', '["a", "b"]', '{"a": '])
+    def test_no_object(self, text):
+        with pytest.raises(ValueError):
+            self.parse(text)
+
+
+class TestGenerateSummariesBatch:
+    """Request counts and fallbacks of generate_summaries_batch"""
+
+    def test_single_request_for_complete_response(self):
+        provider = FakeProvider(f"```json\n{json.dumps(SUMMARIES)}\n```")
+        assert provider.generate_summaries_batch(ITEMS) == SUMMARIES
+        assert provider.batch_calls == 1
+        assert provider.single_calls == []
+
+    def test_missing_file_falls_back_individually(self):
+        provider = FakeProvider(json.dumps({'src/a.py': 'Defines a.'}))
+        result = provider.generate_summaries_batch(ITEMS)
+        assert result == {'src/a.py': 'Defines a.', 'src/b.py': 'single summary of src/b.py'}
+        assert provider.batch_calls == 1
+        assert provider.single_calls == ['src/b.py']
+
+    def test_non_string_summary_falls_back_individually(self):
+        provider = FakeProvider(json.dumps({'src/a.py': 'Defines a.', 'src/b.py': None}))
+        provider.generate_summaries_batch(ITEMS)
+        assert provider.single_calls == ['src/b.py']
+
+    def test_unparseable_response_falls_back_for_all(self):
+        provider = FakeProvider('Sorry, I cannot help with that.')
+        result = provider.generate_summaries_batch(ITEMS)
+        assert result == {path: f'single summary of {path}' for path, _, _ in ITEMS}
+        assert provider.batch_calls == 1
+        assert provider.single_calls == ['src/a.py', 'src/b.py']
+
+    def test_single_item_skips_batch_request(self):
+        provider = FakeProvider(json.dumps(SUMMARIES))
+        result = provider.generate_summaries_batch(ITEMS[:1])
+        assert result == {'src/a.py': 'single summary of src/a.py'}
+        assert provider.batch_calls == 0
+
+    def test_empty_batch(self):
+        provider = FakeProvider()
+        assert provider.generate_summaries_batch([]) == {}
+        assert provider.batch_calls == 0
+
+
+class TestClaudeProvider:
+    """Construction of the Claude provider's pooled HTTP client"""
+
+    def test_construct_and_close(self):
+        anthropic = pytest.importorskip('anthropic')
+        from tldr.llm_providers.claude_provider import ClaudeProvider, MAX_RETRIES
+
+        with ClaudeProvider(api_key='k') as provider:
+            assert provider.model == provider.get_default_model()
+            assert provider.client.max_retries == MAX_RETRIES
+            assert isinstance(provider.client._client, anthropic.DefaultHttpxClient)
+        assert provider.client.is_closed()
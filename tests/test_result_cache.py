@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+test_result_cache.py - Tests for the on-disk cache of signatures and summaries
+
+Covers cache hits, misses and the invalidation of entries when the file, the extractor,
+the cache schema or the summary settings change.
+"""
+
+import sqlite3
+import pytest
+import pygments_tldr
+
+from tldr import result_cache
+from tldr.result_cache import ResultCache
+from tldr.tldr_file_creator import TLDRFileCreator
+from tests.fake_provider import FakeProvider
+
+CODE = b'def greet(name):\n    return name\n'
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = ResultCache(str(tmp_path / 'cache.sqlite'))
+    yield cache
+    cache.close()
+
+
+class TestCacheKey:
+    """Inputs that must change the cache key"""
+
+    def test_same_file_same_key(self):
+        assert ResultCache.key_for('a.py', CODE) == ResultCache.key_for('b/a.py', CODE)
+
+    def test_content_changes_key(self):
+        assert ResultCache.key_for('a.py', CODE) != ResultCache.key_for('a.py', CODE + b'\n')
+
+    def test_extension_changes_key(self):
+        assert ResultCache.key_for('a.py', CODE) != ResultCache.key_for('a.rb', CODE)
+
+    def test_extractor_version_changes_key(self, monkeypatch):
+        key = ResultCache.key_for('a.py', CODE)
+        monkeypatch.setattr(pygments_tldr, '__version__', pygments_tldr.__version__ + '.post1')
+        assert ResultCache.key_for('a.py', CODE) != key
+
+    def test_schema_version_changes_key(self, monkeypatch):
+        key = ResultCache.key_for('a.py', CODE)
+        monkeypatch.setattr(result_cache, 'CACHE_SCHEMA_VERSION', result_cache.CACHE_SCHEMA_VERSION + 1)
+        assert ResultCache.key_for('a.py', CODE) != key
+
+
+class TestResultCache:
+    """Hits and misses of stored signatures and summaries"""
+
+    def test_signatures_miss_then_hit(self, cache):
+        key = ResultCache.key_for('a.py', CODE)
+        assert cache.get_signatures(key) is None
+        cache.put_signatures(key, 'def greet(name)')
+        assert cache.get_signatures(key) == 'def greet(name)'
+
+    def test_summary_hit_requires_same_id(self, cache):
+        key = ResultCache.key_for('a.py', CODE)
+        cache.put_signatures(key, 'def greet(name)')
+        cache.put_summary(key, 'model-a', 'Greets.')
+        assert cache.get_summary(key, 'model-a') == 'Greets.'
+        assert cache.get_summary(key, 'model-b') is None
+
+    def test_new_signatures_drop_summary(self, cache):
+        key = ResultCache.key_for('a.py', CODE)
+        cache.put_signatures(key, 'def greet(name)')
+        cache.put_summary(key, 'model-a', 'Greets.')
+        cache.put_signatures(key, 'def greet(name)')
+        assert cache.get_summary(key, 'model-a') is None
+
+    def test_persists_across_connections(self, tmp_path):
+        path = str(tmp_path / 'cache.sqlite')
+        key = ResultCache.key_for('a.py', CODE)
+        first = ResultCache(path)
+        first.put_signatures(key, 'def greet(name)')
+        first.close()
+        second = ResultCache(path)
+        assert second.get_signatures(key) == 'def greet(name)'
+        second.close()
+
+
+class TestCreatorSummaryCache:
+    """Summaries cached by TLDRFileCreator are only reused with the same settings"""
+
+    def make_creator(self, tmp_path, provider, **kwargs):
+        creator = TLDRFileCreator(use_cache=True, cache_path=str(tmp_path / 'cache.sqlite'), **kwargs)
+        creator.llm_provider = provider
+        return creator
+
+    def store(self, tmp_path, **kwargs):
+        with self.make_creator(tmp_path, FakeProvider(), **kwargs) as creator:
+            key = ResultCache.key_for('a.py', CODE)
+            creator.result_cache.put_signatures(key, 'def greet(name)')
+            creator._store_summary(key, 'Greets.')
+        return key
+
+    def test_hit_with_same_settings(self, tmp_path):
+        key = self.store(tmp_path)
+        with self.make_creator(tmp_path, FakeProvider()) as creator:
+            assert creator._cached_summary(key) == 'Greets.'
+
+    def test_miss_when_content_limit_changes(self, tmp_path):
+        key = self.store(tmp_path, max_content_bytes=1024)
+        with self.make_creator(tmp_path, FakeProvider(), max_content_bytes=2048) as creator:
+            assert creator._cached_summary(key) is None
+
+    def test_miss_when_model_changes(self, tmp_path):
+        key = self.store(tmp_path)
+        provider = FakeProvider()
+        provider.model = 'other-model'
+        with self.make_creator(tmp_path, provider) as creator:
+            assert creator._cached_summary(key) is None
+
+    def test_miss_when_prompt_changes(self, tmp_path, monkeypatch):
+        key = self.store(tmp_path)
+        monkeypatch.setattr(FakeProvider, '_build_summary_prompt',
+                            lambda self, file_path, file_content, signatures: f"Summarize {file_path}")
+        with self.make_creator(tmp_path, FakeProvider()) as creator:
+            assert creator._cached_summary(key) is None
+
+    def test_close_releases_cache(self, tmp_path):
+        creator = self.make_creator(tmp_path, None)
+        cache = creator.result_cache
+        creator.close()
+        assert creator.result_cache is None
+        with pytest.raises(sqlite3.ProgrammingError):
+            cache.get_signatures('missing')
+
+
+class TestCachedExtraction:
+    """The cached extraction path must see the same file content as the uncached one"""
+
+    @pytest.mark.parametrize('newline', [b'\r\n', b'\r'])
+    def test_newlines_match_uncached_path(self, tmp_path, newline):
+        file_path = tmp_path / 'greet.py'
+        file_path.write_bytes(CODE.replace(b'\n', newline))
+        with TLDRFileCreator() as creator:
+            uncached = creator._extract_file(str(file_path), 'now')
+        with TLDRFileCreator(use_cache=True, cache_path=str(tmp_path / 'cache.sqlite')) as creator:
+            cached = creator._extract_file(str(file_path), 'now')
+        assert cached[2] == uncached[2] == CODE.decode('utf-8')
+        assert cached[:2] == uncached[:2]
@@ -7,66 +7,110 @@ signatures from a file by comparing its output with an LLM's assessment.
 """
 
 import os
+import re
 import sys
+import json
+import hashlib
 import logging
 import pytest
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
 
 from tests.signature_extractor_llm import SignatureExtractorLLM
 from tldr.llm_providers import LLMFactory, LLMConfig
 
+# Validation results are cached on disk, keyed by a hash of the model and the full prompt
+VALIDATION_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'tldr', 'validation')
+
+# Lines likely to declare a signature; only these and a few lines around them go into the prompt
+_SIGNATURE_LINE_RE = re.compile(r'\b(?:def|class|function|fn|func|public|private|protected|static)\s')
+VALIDATION_CONTEXT_LINES = 2
+
+
+def _file_cache_key(file_path: str) -> tuple:
+    """Return (absolute path, mtime in ns) so cached results are dropped when a file changes"""
+    abs_path = os.path.abspath(file_path)
+    return abs_path, os.stat(abs_path).st_mtime_ns
+
+
+def _validation_cache_path(model: str, prompt: str) -> str:
+    """Return the cache file for a validation prompt sent to the given model"""
+    key = hashlib.sha256(f"{model}\0{prompt}".encode('utf-8')).hexdigest()
+    return os.path.join(VALIDATION_CACHE_DIR, f"{key}.json")
+
+
+def _load_cached_validation(cache_path: str):
+    """Return the cached validation result, or None if missing or unreadable"""
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _store_cached_validation(cache_path: str, result: dict):
+    """Write a validation result to the cache (best effort)"""
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        temp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(result, f)
+        os.replace(temp_path, cache_path)
+    except OSError as e:
+        logging.debug(f"Could not write validation cache {cache_path}: {e}")
+
+
+def _compact_file_content(file_content: str, context: int = VALIDATION_CONTEXT_LINES) -> str:
+    """
+    Reduce file content to the lines that look like signatures plus `context` lines around each,
+    with '...' marking omitted regions. Returns the content unchanged if nothing matches.
+    """
+    lines = file_content.splitlines()
+    keep = set()
+    for i, line in enumerate(lines):
+        if _SIGNATURE_LINE_RE.search(line):
+            keep.update(range(max(0, i - context), min(len(lines), i + context + 1)))
+    
+    if not keep:
+        return file_content
+    
+    compacted = []
+    previous = -1
+    for i in sorted(keep):
+        if i != previous + 1:
+            compacted.append('...')
+        compacted.append(lines[i])
+        previous = i
+    if previous != len(lines) - 1:
+        compacted.append('...')
+    return '\n'.join(compacted)
+
+
+@lru_cache(maxsize=256)
+def _read_file_cached(abs_path: str, mtime_ns: int) -> str:
+    """Read a file's content, memoized by path and modification time"""
+    return Path(abs_path).read_text(encoding='utf-8')
+
+
+@lru_cache(maxsize=256)
+def _get_signatures_cached(extractor: SignatureExtractorLLM, abs_path: str, mtime_ns: int) -> str:
+    """Extract a file's signatures, memoized by extractor, path and modification time"""
+    return extractor.get_signatures(abs_path)
+
 
 class TestSignatureValidation:
     """Test class for validating signature extraction accuracy"""
     
-    def __init__(self, test_directory: str = None):
-        """
-        Initialize test class
-        
-        Args:
-            test_directory (str, optional): Directory to test all files in
-        """
-        self.test_directory = test_directory
-    
-    def setup_method(self):
-        """Setup test method - initialize signature extractor"""
-        self.signature_extractor = SignatureExtractorLLM()
-        
-        # Try to initialize LLM provider from environment
-        self.llm_provider = None
-        for provider_name in ['grok']:
-            try:
-                config = LLMConfig.from_env(provider_name)
-                self.llm_provider = LLMFactory.create_provider(
-                    provider_name=config.provider,
-                    api_key=config.api_key,
-                    model=config.model
-                )
-                logging.info(f"Using LLM provider: {provider_name}")
-                break
-            except (ValueError, ImportError) as e:
-                logging.debug(f"Could not initialize {provider_name} provider: {e}")
-                raise
-        
-        if not self.llm_provider:
-            pytest.skip("No LLM provider available. Set GROK_API_KEY, ANTHROPIC_API_KEY or OPENAI_API_KEY environment variable.")
+    # One 'FIELD: value' line of the LLM's validation response
+    _RESPONSE_FIELD_RE = re.compile(r'^(ASSESSMENT|MISSING_SIGNATURES|FALSE_POSITIVES|EXPLANATION):\s*(.*)$')
     
-    def create_validation_prompt(self, file_path: str, file_content: str, extracted_signatures: str) -> str:
-        """
-        Create a prompt for the LLM to validate signature extraction
-        
-        Args:
-            file_path (str): Path to the file being analyzed
-            file_content (str): Content of the file
-            extracted_signatures (str): Signatures extracted by signature_extractor
-            
-        Returns:
-            str: Validation prompt for the LLM
-        """
-        return f"""You are a code analysis expert. Please analyze the following file and evaluate whether the signature extractor correctly identified ALL function signatures, method signatures, and other important code signatures.
+    # Validation prompt; filled in by create_validation_prompt
+    _PROMPT_TEMPLATE = """You are a code analysis expert. Please analyze the following file and evaluate whether the signature extractor correctly identified ALL function signatures, method signatures, and other important code signatures.
 
 FILE PATH: {file_path}
 
-FILE CONTENT:
+FILE CONTENT (regions without signatures are omitted and marked with "..."):
 ```
 {file_content}
 ```
@@ -89,7 +133,54 @@ FALSE_POSITIVES: [List any false positives, or "None" if none found]
 EXPLANATION: [Brief explanation of your assessment]
 
 Be thorough and precise in your analysis."""
+    
+    # Directory to test all files in; set by the command line runner (pytest leaves it unset)
+    test_directory = None
+    
+    @classmethod
+    def setup_llm(cls):
+        """Setup shared by all tests in the class - initialize signature extractor and LLM provider"""
+        # Both the extractor and the validating provider need an LLM; skip when either is unavailable
+        try:
+            cls.signature_extractor = SignatureExtractorLLM()
+            config = LLMConfig.from_env('grok')
+            cls.llm_provider = LLMFactory.create_provider(
+                provider_name=config.provider,
+                api_key=config.api_key,
+                model=config.model
+            )
+        except (ValueError, ImportError) as e:
+            pytest.skip(f"No LLM provider available ({e}). Set ANTHROPIC_API_KEY and GROK_API_KEY environment variables.")
+        logging.info(f"Using LLM provider: {config.provider}")
+    
+    @pytest.fixture(scope='class', autouse=True)
+    @classmethod
+    def _llm(cls):
+        """Build the extractor and provider once per test class rather than before every test"""
+        cls.setup_llm()
+    
+    def create_validation_prompt(self, file_path: str, file_content: str, extracted_signatures: str) -> str:
+        """
+        Create a prompt for the LLM to validate signature extraction
+        
+        Args:
+            file_path (str): Path to the file being analyzed
+            file_content (str): Content of the file
+            extracted_signatures (str): Signatures extracted by signature_extractor
+            
+        Returns:
+            str: Validation prompt for the LLM
+        """
+        return self._PROMPT_TEMPLATE.format_map({
+            'file_path': file_path,
+            'file_content': _compact_file_content(file_content),
+            'extracted_signatures': extracted_signatures,
+        })
 
+    def _get_signatures(self, file_path: str) -> str:
+        """Extract signatures, reusing the earlier result if the file has not changed"""
+        return _get_signatures_cached(self.signature_extractor, *_file_cache_key(file_path))
+    
     def validate_signatures_with_llm(self, file_path: str, extracted_signatures: str) -> dict:
         """
         Use LLM to validate extracted signatures
@@ -102,51 +193,101 @@ Be thorough and precise in your analysis."""
             dict: Validation results from LLM
         """
         # Read the file content
-        with open(file_path, 'r', encoding='utf-8') as f:
-            file_content = f.read()
+        file_content = _read_file_cached(*_file_cache_key(file_path))
         
         # Create validation prompt
         prompt = self.create_validation_prompt(file_path, file_content, extracted_signatures)
         
-        # Get LLM response using the private API call method with higher token limit for validation
-        response = self.llm_provider._make_api_call(prompt, max_tokens=2000)
-        logging.debug(f"LLM response: {response}")
-        # Parse the response
-        response_text = response.content.strip()
+        # Identical prompts (same file content and signatures) were already validated
+        cache_path = _validation_cache_path(self.llm_provider.model, prompt)
+        cached_result = _load_cached_validation(cache_path)
+        if cached_result is not None:
+            logging.debug(f"Using cached validation result for {file_path}")
+            return cached_result
         
-        # Extract structured information from response
-        lines = response_text.split('\n')
         result = {
             'assessment': 'UNKNOWN',
             'missing_signatures': [],
             'false_positives': [],
             'explanation': '',
-            'full_response': response_text
+            'full_response': ''
         }
         
-        for line in lines:
-            line = line.strip()
-            if line.startswith('ASSESSMENT:'):
-                result['assessment'] = line.split(':', 1)[1].strip()
-            elif line.startswith('MISSING_SIGNATURES:'):
-                missing = line.split(':', 1)[1].strip()
-                if missing.lower() != 'none':
-                    result['missing_signatures'] = [s.strip() for s in missing.split(',')]
-            elif line.startswith('FALSE_POSITIVES:'):
-                false_pos = line.split(':', 1)[1].strip()
-                if false_pos.lower() != 'none':
-                    result['false_positives'] = [s.strip() for s in false_pos.split(',')]
-            elif line.startswith('EXPLANATION:'):
-                result['explanation'] = line.split(':', 1)[1].strip()
+        # Stream the LLM response using the private API method with higher token limit for
+        # validation, parsing each line as it arrives
+        response_lines = []
+        seen_fields = set()
+        stream = self.llm_provider._stream_lines(prompt, max_tokens=800)
+        try:
+            for line in stream:
+                response_lines.append(line)
+                match = self._RESPONSE_FIELD_RE.match(line.strip())
+                if not match:
+                    continue
+                
+                key, value = match.group(1), match.group(2).strip()
+                if key == 'ASSESSMENT':
+                    result['assessment'] = value
+                elif key == 'MISSING_SIGNATURES':
+                    if value.lower() != 'none':
+                        result['missing_signatures'] = [s.strip() for s in value.split(',')]
+                elif key == 'FALSE_POSITIVES':
+                    if value.lower() != 'none':
+                        result['false_positives'] = [s.strip() for s in value.split(',')]
+                elif key == 'EXPLANATION':
+                    result['explanation'] = value
+                seen_fields.add(key)
+                
+                # Every field has been read, stop generating the rest of the response
+                if len(seen_fields) == 4:
+                    break
+        finally:
+            stream.close()
+        
+        result['full_response'] = '\n'.join(response_lines).strip()
+        logging.debug(f"LLM response: {result['full_response']}")
+        
+        # Only cache responses the LLM actually answered in the expected format
+        if 'ASSESSMENT' in seen_fields:
+            _store_cached_validation(cache_path, result)
         
         return result
     
+    def _extract_and_validate(self, test_file: str) -> dict:
+        """
+        Extract signatures from a file and validate them with the LLM
+        
+        Args:
+            test_file (str): Path to the file to analyze
+            
+        Returns:
+            dict: Validation results, with assessment 'ERROR' if processing failed
+        """
+        try:
+            # Extract signatures
+            extracted_signatures = self._get_signatures(test_file)
+            
+            # Validate with LLM
+            validation_result = self.validate_signatures_with_llm(test_file, extracted_signatures)
+            validation_result['file_path'] = test_file
+            
+            logging.info(f"File: {os.path.basename(test_file)} - Assessment: {validation_result['assessment']}")
+            return validation_result
+            
+        except Exception as e:
+            logging.error(f"Error processing {test_file}: {e}")
+            return {
+                'file_path': test_file,
+                'assessment': 'ERROR',
+                'explanation': str(e)
+            }
+    
     def _is_programming_file(self, file_path: str) -> bool:
         """
         Check if a file is a programming file worth testing
         
         Args:
-            file_path (str): Path to the file
+            file_path (str): Path to a regular file (callers check that it is a file)
             
         Returns:
             bool: True if file should be tested
@@ -155,10 +296,6 @@ Be thorough and precise in your analysis."""
         if os.path.basename(file_path).startswith('.'):
             return False
         
-        # Skip non-files
-        if not os.path.isfile(file_path):
-            return False
-        
         # Common programming file extensions
         programming_extensions = {
             '.py', '.java', '.js', '.ts', '.cpp', '.c', '.h', '.hpp',
@@ -208,13 +345,14 @@ Be thorough and precise in your analysis."""
                 
                 for filename in filenames:
                     file_path = os.path.join(root, filename)
-                    if self._is_programming_file(file_path):
+                    if os.path.isfile(file_path) and self._is_programming_file(file_path):
                         files.append(file_path)
         else:
-            for item in os.listdir(directory):
-                file_path = os.path.join(directory, item)
-                if self._is_programming_file(file_path):
-                    files.append(file_path)
+            # DirEntry.is_file() uses the type from the directory listing, no extra stat per entry
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_file() and self._is_programming_file(entry.path):
+                        files.append(entry.path)
         
         return sorted(files)
     
@@ -258,7 +396,7 @@ Be thorough and precise in your analysis."""
                 logging.info(f"Processing file {i}/{len(test_files)}: {os.path.relpath(test_file, test_dir)}")
                 
                 # Extract signatures
-                extracted_signatures = self.signature_extractor.get_signatures(test_file)
+                extracted_signatures = self._get_signatures(test_file)
                 
                 # Validate with LLM
                 validation_result = self.validate_signatures_with_llm(test_file, extracted_signatures)
@@ -325,7 +463,7 @@ Be thorough and precise in your analysis."""
         test_file = os.path.join(os.path.dirname(__file__), '..', 'tldr', 'signature_extractor.py')
         
         # Extract signatures
-        extracted_signatures = self.signature_extractor.get_signatures(test_file)
+        extracted_signatures = self._get_signatures(test_file)
         
         # Validate with LLM
         validation_result = self.validate_signatures_with_llm(test_file, extracted_signatures)
@@ -350,7 +488,7 @@ Be thorough and precise in your analysis."""
         test_file = os.path.join(os.path.dirname(__file__), '..', 'tldr', 'tldr_file_creator.py')
         
         # Extract signatures
-        extracted_signatures = self.signature_extractor.get_signatures(test_file)
+        extracted_signatures = self._get_signatures(test_file)
         
         # Validate with LLM
         validation_result = self.validate_signatures_with_llm(test_file, extracted_signatures)
@@ -387,30 +525,19 @@ Be thorough and precise in your analysis."""
             if os.path.exists(filepath):
                 test_files.append(filepath)
         
-        results = []
+        existing_files = []
         for test_file in test_files:
             if not os.path.exists(test_file):
                 logging.warning(f"File not found: {test_file}")
                 continue
-                
-            try:
-                # Extract signatures
-                extracted_signatures = self.signature_extractor.get_signatures(test_file)
-                
-                # Validate with LLM
-                validation_result = self.validate_signatures_with_llm(test_file, extracted_signatures)
-                validation_result['file_path'] = test_file
-                results.append(validation_result)
-                
-                logging.info(f"File: {os.path.basename(test_file)} - Assessment: {validation_result['assessment']}")
-                
-            except Exception as e:
-                logging.error(f"Error processing {test_file}: {e}")
-                results.append({
-                    'file_path': test_file,
-                    'assessment': 'ERROR',
-                    'explanation': str(e)
-                })
+            existing_files.append(test_file)
+        
+        # Each file needs two LLM round-trips (extraction + validation); run the files
+        # concurrently so the total wait is roughly the slowest file, not the sum
+        results = []
+        if existing_files:
+            with ThreadPoolExecutor(max_workers=len(existing_files)) as executor:
+                results = list(executor.map(self._extract_and_validate, existing_files))
         
         # Summary report
         passed = sum(1 for r in results if r['assessment'].upper() == 'PASS')
@@ -467,8 +594,9 @@ if __name__ == '__main__':
             if args.max_files:
                 print(f"Max files: {args.max_files}")
             
-            test_instance = TestSignatureValidation(test_directory=args.directory)
-            test_instance.setup_method()
+            test_instance = TestSignatureValidation()
+            test_instance.test_directory = args.directory
+            test_instance.setup_llm()
             
             results = test_instance.test_signature_extraction_on_directory(
                 directory=args.directory,
@@ -481,11 +609,15 @@ if __name__ == '__main__':
             # Default comprehensive test
             print("Running signature extraction validation test...")
             test_instance = TestSignatureValidation()
-            test_instance.setup_method()
+            test_instance.setup_llm()
             
             test_instance.test_signature_extraction_on_specified_files()
             print("Test completed!")
             
+    except pytest.skip.Exception as e:
+        # pytest.skip raises a BaseException, which the handler below would not catch
+        print(f"Skipped: {e}")
+        sys.exit(1)
     except Exception as e:
         print(f"Error during testing: {e}")
         sys.exit(1)
\ No newline at end of file
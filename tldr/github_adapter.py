@@ -19,14 +19,22 @@ import shutil
 import subprocess
 import traceback
 import time
+from collections import deque
 from pathlib import Path
 from urllib.parse import urlparse
 
-from .tldr_file_creator import TLDRFileCreator
+from .tldr_file_creator import TLDRFileCreator, MAX_WORKERS, MAX_FILE_SIZE_BYTES
 
 # Configure logging to write to both console and file
 def setup_logging():
     """Setup logging configuration for github_adapter"""
+    # Get the root logger
+    logger = logging.getLogger()
+    
+    # Leave logging alone if the host application (or test runner) already configured it
+    if logger.handlers:
+        return
+    
     log_dir = os.path.join(os.path.dirname(__file__), '..', 'logs')
     os.makedirs(log_dir, exist_ok=True)
     log_file = os.path.join(log_dir, 'github_adapter.log')
@@ -36,14 +44,8 @@ def setup_logging():
         "%(asctime)s - %(name)s - %(levelname)s - %(funcName)s(): - %(message)s"
     )
     
-    # Get the root logger
-    logger = logging.getLogger()
     logger.setLevel(logging.INFO)
     
-    # Remove existing handlers to avoid duplicates
-    for handler in logger.handlers[:]:
-        logger.removeHandler(handler)
-    
     # Console handler
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(formatter)
@@ -59,8 +61,12 @@ def setup_logging():
 # Setup logging when module is imported
 setup_logging()
 
+# Lines of git output kept for the error message when a clone fails
+GIT_OUTPUT_TAIL_LINES = 20
+
 class GitHubAdapter:
-    def __init__(self, llm_provider: str = None, skip_file_summary: bool = True, terse_output: bool = False):
+    def __init__(self, llm_provider: str = None, skip_file_summary: bool = True, terse_output: bool = False,
+                 concurrency: int = MAX_WORKERS, use_cache: bool = False, max_file_size: int = MAX_FILE_SIZE_BYTES):
         """
         Initialize the GitHub adapter.
         
@@ -68,12 +74,19 @@ class GitHubAdapter:
             llm_provider (str): Optional LLM provider for generating summaries (default: None)
             skip_file_summary (bool): Skip generating file summaries using LLM (default: True)
             terse_output (bool): Exclude files with 0 signatures from output (default: False)
+            concurrency (int): Number of files to process in parallel (default: MAX_WORKERS)
+            use_cache (bool): Reuse signatures and summaries of unchanged files from the on-disk cache (default: False)
+            max_file_size (int): Skip files larger than this many bytes, None for no limit (default: MAX_FILE_SIZE_BYTES)
         """
         self.llm_provider = llm_provider
         self.skip_file_summary = skip_file_summary
         self.terse_output = terse_output
+        self.concurrency = concurrency
+        self.use_cache = use_cache
+        self.max_file_size = max_file_size
         
-    def  process_github_repo(self, github_url: str, output_dir: str = None, cleanup: bool = True):
+    def  process_github_repo(self, github_url: str, output_dir: str = None, cleanup: bool = True,
+                             full_clone: bool = False):
         """
         Download a GitHub repository and create a TLDR file.
         
@@ -82,6 +95,7 @@ class GitHubAdapter:
             output_dir (str): Directory to download the repo to. If None, uses temp directory
             cleanup (bool): Whether to clean up the downloaded repo after processing
             recursive (bool): Whether to process subdirectories recursively (default: True)
+            full_clone (bool): Clone the full history instead of only the latest commit (default: False)
             
         Returns:
             str: Path to the generated TLDR file
@@ -112,7 +126,7 @@ class GitHubAdapter:
             logging.info(f"Downloading repository {github_url} to {download_path}")
             
             # Download the repository
-            self._download_repo(github_url, download_path)
+            self._download_repo(github_url, download_path, full_clone=full_clone)
             download_end = time.time()
             logging.info(f"Repository download completed in {download_end - download_start:.2f} seconds")
             
@@ -121,9 +135,11 @@ class GitHubAdapter:
             tldr_filename = os.path.join(download_path, f"{repo_name}.tldr.json")
             logging.info(f"Creating TLDR file: {tldr_filename}")
             
-            creator = TLDRFileCreator(llm_provider=self.llm_provider, skip_file_summary=self.skip_file_summary,
-                                      terse_output=self.terse_output, local=False, github_url=github_url)
-            output_filename = creator.create_tldr_file(download_path, tldr_filename)
+            with TLDRFileCreator(llm_provider=self.llm_provider, skip_file_summary=self.skip_file_summary,
+                                 terse_output=self.terse_output, local=False, github_url=github_url,
+                                 concurrency=self.concurrency, use_cache=self.use_cache,
+                                 max_file_size=self.max_file_size) as creator:
+                output_filename = creator.create_tldr_file(download_path, tldr_filename)
             logging.info(f"TLDR file created: {output_filename}")
             tldr_end = time.time()
             logging.info(f"TLDR file creation completed in {tldr_end - tldr_start:.2f} seconds")
@@ -206,13 +222,17 @@ class GitHubAdapter:
             
         return repo_name
     
-    def _download_repo(self, github_url: str, local_path: str):
+    def _download_repo(self, github_url: str, local_path: str, full_clone: bool = False):
         """
         Download repository using git clone.
         
+        Only the working tree is scanned, so by default just the latest commit of the
+        default branch is fetched.
+        
         Args:
             github_url (str): GitHub repository URL
             local_path (str): Local path to clone to
+            full_clone (bool): Fetch the full history, all branches and tags (default: False)
         """
         try:
             # Remove directory if it already exists
@@ -220,15 +240,28 @@ class GitHubAdapter:
                 shutil.rmtree(local_path)
             
             # Clone the repository
-            cmd = ['git', 'clone', github_url, local_path]
-            result = subprocess.run(
+            if full_clone:
+                cmd = ['git', 'clone', '--quiet', github_url, local_path]
+            else:
+                cmd = ['git', 'clone', '--quiet', '--depth=1', '--single-branch', '--no-tags', github_url, local_path]
+            
+            # Stream git's output to the log instead of buffering all of it, keeping only the
+            # last lines for the error message
+            recent_output = deque(maxlen=GIT_OUTPUT_TAIL_LINES)
+            with subprocess.Popen(
                 cmd,
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
                 text=True,
-                check=True
-            )
+                bufsize=1
+            ) as process:
+                for line in process.stdout:
+                    line = line.rstrip()
+                    logging.debug(f"Git clone output: {line}")
+                    recent_output.append(line)
             
-            logging.debug(f"Git clone output: {result.stdout}")
+            if process.returncode != 0:
+                raise subprocess.CalledProcessError(process.returncode, cmd, stderr='\n'.join(recent_output))
             
             if not os.path.exists(local_path):
                 raise Exception("Repository was not cloned successfully")
@@ -6,8 +6,17 @@ This module implements the Claude LLM provider for generating file summaries.
 """
 
 import logging
+import importlib.util
+from typing import Iterator
 from .llm_provider import LLMProvider, LLMResponse
 
+# Connection pool shared by all requests of a provider, sized for the concurrent summary workers
+HTTP_MAX_CONNECTIONS = 64
+HTTP_TIMEOUT_SECONDS = 60.0
+
+# SDK-level retries for transient errors such as 429 and 5xx responses
+MAX_RETRIES = 3
+
 
 class ClaudeProvider(LLMProvider):
     """Claude (Anthropic) LLM provider implementation"""
@@ -16,9 +25,23 @@ class ClaudeProvider(LLMProvider):
         super().__init__(api_key, model)
         try:
             import anthropic
-            self.client = anthropic.Anthropic(api_key=api_key)
         except ImportError:
             raise ImportError("anthropic package is required for Claude provider. Install with: pip install anthropic")
+        
+        # One keep-alive client for every call; HTTP/2 multiplexes requests over a single TLS
+        # connection when the optional h2 package is installed. DefaultHttpxClient and the
+        # Limits type come from the SDK so they match the HTTP package it is built on.
+        limits_type = type(anthropic.DEFAULT_CONNECTION_LIMITS)
+        http_client = anthropic.DefaultHttpxClient(
+            http2=importlib.util.find_spec('h2') is not None,
+            limits=limits_type(max_keepalive_connections=HTTP_MAX_CONNECTIONS, max_connections=HTTP_MAX_CONNECTIONS),
+            timeout=anthropic.Timeout(HTTP_TIMEOUT_SECONDS)
+        )
+        self.client = anthropic.Anthropic(api_key=api_key, http_client=http_client, max_retries=MAX_RETRIES)
+    
+    def close(self):
+        """Close the underlying HTTP connections"""
+        self.client.close()
     
     def get_default_model(self) -> str:
         """Return the default Claude model"""
@@ -46,6 +69,21 @@ class ClaudeProvider(LLMProvider):
                 model=self.model,
                 provider="claude"
             )
+        except Exception as e:
+            logging.error(f"Claude API error: {e}")
+            raise Exception(f"Claude API error: {e}")
+    
+    def _make_api_call_stream(self, prompt: str, max_tokens: int = 200) -> Iterator[str]:
+        """Stream the API call to Claude, yielding text chunks as they arrive"""
+        try:
+            with self.client.messages.stream(
+                model=self.model,
+                max_tokens=max_tokens,
+                temperature=0.3,  # Low temperature for consistent technical summaries
+                messages=[{"role": "user", "content": prompt}]
+            ) as stream:
+                for text in stream.text_stream:
+                    yield text
         except Exception as e:
             logging.error(f"Claude API error: {e}")
             raise Exception(f"Claude API error: {e}")
\ No newline at end of file
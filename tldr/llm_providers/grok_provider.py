@@ -7,8 +7,12 @@ Grok typically uses an OpenAI-compatible API structure.
 """
 
 import logging
+import threading
 import requests
 import json
+from typing import Iterator
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .llm_provider import LLMProvider, LLMResponse
 
@@ -16,13 +20,33 @@ from .llm_provider import LLMProvider, LLMResponse
 class GrokProvider(LLMProvider):
     """Grok (xAI) LLM provider implementation"""
     
-    def __init__(self, api_key: str, model: str = None):
+    # Pooled session shared by all Grok providers so TCP/TLS connections are reused across calls
+    _shared_session = None
+    _session_lock = threading.Lock()
+    
+    def __init__(self, api_key: str, model: str = None, session: requests.Session = None):
         super().__init__(api_key, model)
         self.base_url = "https://api.x.ai/v1"
         self.headers = {
             "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json"
         }
+        self.session = session or self._get_shared_session()
+    
+    @classmethod
+    def _get_shared_session(cls) -> requests.Session:
+        """Return the process-wide pooled session, creating it on first use"""
+        with cls._session_lock:
+            if cls._shared_session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=10,
+                    pool_maxsize=20,
+                    max_retries=Retry(total=3, backoff_factor=0.3)
+                )
+                session.mount('https://', adapter)
+                cls._shared_session = session
+            return cls._shared_session
     
     def get_default_model(self) -> str:
         """Return the default Grok model"""
@@ -33,22 +57,25 @@ class GrokProvider(LLMProvider):
         prompt = self._build_summary_prompt(file_path, file_content, signatures)
         return self._make_api_call(prompt, max_tokens=200)
     
+    def _build_payload(self, prompt: str, max_tokens: int, stream: bool) -> dict:
+        """Prepare the request payload (OpenAI-compatible format)"""
+        return {
+            "model": self.model,
+            "messages": [
+                {"role": "user", "content": prompt}
+            ],
+            "max_tokens": max_tokens,
+            "temperature": 0.3,  # Low temperature for consistent technical summaries
+            "stream": stream
+        }
+    
     def _make_api_call(self, prompt: str, max_tokens: int = 200) -> LLMResponse:
         """Make the actual API call to Grok"""
         try:
-            # Prepare the request payload (OpenAI-compatible format)
-            payload = {
-                "model": self.model,
-                "messages": [
-                    {"role": "user", "content": prompt}
-                ],
-                "max_tokens": max_tokens,
-                "temperature": 0.3,  # Low temperature for consistent technical summaries
-                "stream": False
-            }
+            payload = self._build_payload(prompt, max_tokens, stream=False)
             
             # Make the API request
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/chat/completions",
                 headers=self.headers,
                 json=payload,
@@ -91,6 +118,41 @@ class GrokProvider(LLMProvider):
             logging.error(f"Grok API error: {e}")
             raise Exception(f"Grok API error: {e}")
 
+    def _make_api_call_stream(self, prompt: str, max_tokens: int = 200) -> Iterator[str]:
+        """Stream the API call to Grok, yielding content deltas from the server-sent events"""
+        try:
+            payload = self._build_payload(prompt, max_tokens, stream=True)
+            
+            with self.session.post(
+                f"{self.base_url}/chat/completions",
+                headers=self.headers,
+                json=payload,
+                timeout=60,
+                stream=True
+            ) as response:
+                response.raise_for_status()
+                
+                for line in response.iter_lines():
+                    # Events look like 'data: {...}', terminated by 'data: [DONE]'
+                    if not line.startswith(b'data: '):
+                        continue
+                    data = line[len(b'data: '):]
+                    if data == b'[DONE]':
+                        break
+                    
+                    choices = json.loads(data).get("choices")
+                    if choices:
+                        content = choices[0].get("delta", {}).get("content")
+                        if content:
+                            yield content
+                
+        except requests.exceptions.RequestException as e:
+            logging.error(f"Grok API request error: {e}")
+            raise Exception(f"Grok API request error: {e}")
+        except json.JSONDecodeError as e:
+            logging.error(f"Failed to parse Grok API stream: {e}")
+            raise Exception(f"Failed to parse Grok API stream: {e}")
+
     def get_available_models(self) -> list:
         """
         Get list of available models from Grok API
@@ -99,7 +161,7 @@ class GrokProvider(LLMProvider):
             list: List of available model names
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/models",
                 headers=self.headers,
                 timeout=30
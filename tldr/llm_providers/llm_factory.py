@@ -33,7 +33,7 @@ class LLMFactory:
                 logging.warning(f"Grok provider not available: {e}")
     
     @classmethod
-    def create_provider(cls, provider_name: str, api_key: str, model: str = None) -> LLMProvider:
+    def create_provider(cls, provider_name: str, api_key: str, model: str = None, **kwargs) -> LLMProvider:
         """
         Create an LLM provider instance
         
@@ -41,6 +41,7 @@ class LLMFactory:
             provider_name (str): Name of the provider ('claude', 'openai', etc.)
             api_key (str): API key for the provider
             model (str, optional): Specific model to use
+            **kwargs: Provider-specific options (e.g. session for Grok)
             
         Returns:
             LLMProvider: Configured provider instance
@@ -56,7 +57,7 @@ class LLMFactory:
             raise ValueError(f"Unknown provider '{provider_name}'. Available: {available}")
         
         provider_class = cls._providers[provider_name.lower()]
-        return provider_class(api_key=api_key, model=model)
+        return provider_class(api_key=api_key, model=model, **kwargs)
     
     @classmethod
     def register_provider(cls, name: str, provider_class: Type[LLMProvider]):
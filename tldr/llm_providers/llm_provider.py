@@ -6,10 +6,16 @@ This module defines the interface that all LLM providers must implement
 for generating file summaries in the TLDR system.
 """
 
+import json
+import hashlib
+import logging
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from dataclasses import dataclass
 
+# Response token budget per file for batched summaries (matches the single-file limit)
+BATCH_SUMMARY_MAX_TOKENS_PER_FILE = 200
+
 
 @dataclass
 class LLMResponse:
@@ -27,6 +33,28 @@ class LLMProvider(ABC):
         self.api_key = api_key
         self.model = model or self.get_default_model()
     
+    def close(self):
+        """Release any network resources held by the provider"""
+        pass
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def summary_cache_id(self) -> str:
+        """
+        Identify the settings a summary depends on besides the file itself.
+        
+        Returns:
+            str: The model and a hash of the summary prompts, so cached summaries are
+                 not reused after either changes
+        """
+        prompts = self._build_summary_prompt('', '', '') + '\0' + self._build_batch_summary_prompt([])
+        prompt_hash = hashlib.blake2b(prompts.encode('utf-8'), digest_size=8).hexdigest()
+        return f"{self.model}:{prompt_hash}"
+    
     @abstractmethod
     def get_default_model(self) -> str:
         """Return the default model for this provider"""
@@ -37,11 +65,65 @@ class LLMProvider(ABC):
         """Generate a file summary given the file content and signatures"""
         pass
     
+    def generate_summaries_batch(self, items: List[Tuple[str, str, str]]) -> Dict[str, str]:
+        """
+        Generate summaries for several files with a single request.
+        
+        Args:
+            items: (file_path, file_content, signatures) for each file
+            
+        Returns:
+            Dict mapping each file path to its summary. Files missing from the batched
+            response (or all of them, if it cannot be parsed) are summarized one by one.
+        """
+        summaries = {}
+        if len(items) > 1:
+            prompt = self._build_batch_summary_prompt(items)
+            try:
+                response = self._make_api_call(prompt, max_tokens=BATCH_SUMMARY_MAX_TOKENS_PER_FILE * len(items))
+                summaries = self._parse_batch_summaries(response.content)
+            except ValueError as e:
+                logging.warning(f"Could not parse batched summary response, summarizing files individually: {e}")
+        
+        results = {}
+        for file_path, file_content, signatures in items:
+            summary = summaries.get(file_path)
+            if not isinstance(summary, str):
+                summary = self.generate_summary(file_path, file_content, signatures).content
+            results[file_path] = summary.strip()
+        return results
+    
     @abstractmethod
     def _make_api_call(self, prompt: str, max_tokens: int) -> LLMResponse:
         """Make the actual API call to the LLM provider"""
         pass
     
+    def _make_api_call_stream(self, prompt: str, max_tokens: int) -> Iterator[str]:
+        """
+        Stream the API call, yielding response text chunks as they arrive.
+        
+        Providers without a streaming API fall back to a single chunk holding the full response.
+        """
+        yield self._make_api_call(prompt, max_tokens=max_tokens).content
+    
+    def _stream_lines(self, prompt: str, max_tokens: int) -> Iterator[str]:
+        """
+        Stream the API call, yielding the response one complete line at a time.
+        
+        Closing this generator early also closes the underlying stream.
+        """
+        stream = self._make_api_call_stream(prompt, max_tokens=max_tokens)
+        try:
+            buffer = ''
+            for text in stream:
+                buffer += text
+                *lines, buffer = buffer.split('\n')
+                yield from lines
+            if buffer:
+                yield buffer
+        finally:
+            stream.close()
+    
     def _build_summary_prompt(self, file_path: str, file_content: str, signatures: str) -> str:
         """Build a standardized prompt for file summarization"""
         return f"""Analyze this code file and provide a concise summary (under 500 characters) of what it does.
@@ -54,4 +136,49 @@ Signatures:
 Code:
 {file_content}
 
-Provide a clear, technical summary focusing on the file's main purpose and functionality. Keep it under 500 characters."""
\ No newline at end of file
+Provide a clear, technical summary focusing on the file's main purpose and functionality. Keep it under 500 characters."""
+    
+    def _build_batch_summary_prompt(self, items: List[Tuple[str, str, str]]) -> str:
+        """Build a prompt asking for a JSON object of summaries for several files"""
+        sections = []
+        for file_path, file_content, signatures in items:
+            sections.append(f"""=== File: {file_path} ===
+
+Signatures:
+{signatures}
+
+Code:
+{file_content}""")
+        files_text = "\n\n".join(sections)
+        return f"""Analyze each of the following {len(items)} code files and provide a concise summary (under 500 characters) of what each one does.
+
+{files_text}
+
+Respond with only a JSON object that maps each file path, exactly as given after "File:", to a clear, technical summary focusing on the file's main purpose and functionality. Keep each summary under 500 characters."""
+    
+    def _parse_batch_summaries(self, response_text: str) -> Dict[str, Any]:
+        """
+        Parse the JSON object of a batched summary response.
+        
+        The object is decoded from the first '{' where a JSON object starts, so a code fence
+        or prose around it (including braces in that prose) is ignored.
+        
+        Raises:
+            ValueError: If the response contains no JSON object
+        """
+        text = response_text.strip()
+        if text.startswith('```'):
+            # Drop the opening fence line (e.g. ```json); anything after the object is ignored anyway
+            text = text.partition('\n')[2]
+        
+        decoder = json.JSONDecoder()
+        start = text.find('{')
+        while start != -1:
+            try:
+                summaries, _ = decoder.raw_decode(text, start)
+            except ValueError:
+                summaries = None
+            if isinstance(summaries, dict):
+                return summaries
+            start = text.find('{', start + 1)
+        raise ValueError("no JSON object in response")
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+result_cache.py - On-disk cache of extracted signatures and LLM summaries
+
+Results are keyed by a hash of the file's extension and content, the cache schema version
+and the signature extractor version, so unchanged files skip both signature extraction and
+the LLM call on later runs while upgrades never serve stale results.
+"""
+
+import os
+import sqlite3
+import hashlib
+import logging
+import threading
+
+import pygments_tldr
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'tldr', 'cache.sqlite')
+
+# Bump when the format of the cached signatures or summaries changes
+CACHE_SCHEMA_VERSION = 1
+
+
+class ResultCache:
+    """SQLite-backed cache of (signatures, summary) per file content, safe to share between threads"""
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH):
+        """
+        Open (creating if needed) the cache database.
+
+        Args:
+            path (str): Location of the SQLite database (default: ~/.cache/tldr/cache.sqlite)
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock:
+            # WAL keeps each small write cheap; the cache can always be rebuilt, so no full sync
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS results ('
+                'hash TEXT PRIMARY KEY, signatures TEXT NOT NULL, summary TEXT, summary_model TEXT)'
+            )
+            self._conn.commit()
+        logging.debug(f"Opened result cache at {path}")
+
+    @staticmethod
+    def key_for(file_path: str, data: bytes) -> str:
+        """
+        Return the cache key for a file.
+
+        The extension is part of the key because it selects the lexer used for extraction, and the
+        schema and extractor versions are part of it so that upgrades invalidate older entries.
+
+        Args:
+            file_path (str): Path of the file
+            data (bytes): Raw file content
+
+        Returns:
+            str: Hex digest identifying the file's extension and content
+        """
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(f"{CACHE_SCHEMA_VERSION}\0{pygments_tldr.__version__}\0".encode('utf-8'))
+        digest.update(os.path.splitext(file_path)[1].encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(data)
+        return digest.hexdigest()
+
+    def get_signatures(self, key: str):
+        """Return the cached signatures text for a key, or None on a miss"""
+        with self._lock:
+            row = self._conn.execute('SELECT signatures FROM results WHERE hash = ?', (key,)).fetchone()
+        return row[0] if row else None
+
+    def put_signatures(self, key: str, signatures: str):
+        """Store the signatures text for a key, dropping any summary of older content"""
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO results (hash, signatures) VALUES (?, ?)', (key, signatures)
+            )
+            self._conn.commit()
+
+    def get_summary(self, key: str, summary_id: str):
+        """
+        Return the cached summary for a key if it was generated with the given settings, else None.
+
+        Args:
+            key (str): Cache key of the file
+            summary_id (str): Identifies the model, prompt and content limit used for the summary
+
+        Returns:
+            str: The cached summary, or None on a miss
+        """
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT summary FROM results WHERE hash = ? AND summary_model = ?', (key, summary_id)
+            ).fetchone()
+        return row[0] if row else None
+
+    def put_summary(self, key: str, summary_id: str, summary: str):
+        """Store the summary generated with the given settings for a key (its signatures must be cached)"""
+        with self._lock:
+            self._conn.execute(
+                'UPDATE results SET summary = ?, summary_model = ? WHERE hash = ?', (summary, summary_id, key)
+            )
+            self._conn.commit()
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
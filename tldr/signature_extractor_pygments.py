@@ -1,5 +1,7 @@
 import logging
 import os
+import sys
+from pathlib import Path
 
 from pygments_tldr import highlight
 from pygments_tldr.formatters.tldr import TLDRFormatter
@@ -8,14 +10,25 @@ from pygments_tldr.util import ClassNotFound
 
 
 class SignatureExtractor():
+    def __init__(self):
+        # Lexers resolved so far, keyed by file extension (or file name if it has none)
+        self._lexer_cache = {}
+
     def get_signatures(self, filename):
         """
         Extracts function signatures from the provided code.
         """
-        # Parse command line options
-        show_linenos = False
-        full_document = False
+        signatures, _ = self.get_signatures_with_content(filename)
+        return signatures
 
+    def get_signatures_with_content(self, filename):
+        """
+        Extracts function signatures and also returns the file content that was read,
+        so callers that need the source as well don't have to read the file again.
+
+        Returns:
+            tuple: (signatures, file content)
+        """
         # Check if file exists
         if not os.path.exists(filename):
             logging.error(f"Error: File '{filename}' not found.")
@@ -23,16 +36,32 @@ class SignatureExtractor():
 
         try:
             # Read the file
-            with open(filename, 'r', encoding='utf-8') as f:
-                code = f.read()
+            code = Path(filename).read_text(encoding='utf-8')
+        except Exception as e:
+            logging.error(f"Error processing file {filename}: {e}")
+            raise
+
+        # Extraction errors are logged by get_signatures_from_code itself
+        return self.get_signatures_from_code(filename, code), code
+
+    def get_signatures_from_code(self, filename, code):
+        """
+        Extracts function signatures from source code that has already been read.
+
+        Args:
+            filename (str): Name or path of the file, used to pick the lexer
+            code (str): Source code of the file
+
+        Returns:
+            str: Extracted signatures
+        """
+        # Parse command line options
+        show_linenos = False
+        full_document = False
 
+        try:
             # Get appropriate lexer for the file
-            try:
-                lexer = get_lexer_for_filename(filename)
-            except ClassNotFound:
-                # Fallback to text lexer if file type not recognized
-                logging.error(f"Warning: Could not determine lexer for '{filename}', using text")
-                lexer = get_lexer_by_name('text')
+            lexer = self._get_lexer(filename)
 
             # Create formatter with options
             formatter_options = {
@@ -62,23 +91,37 @@ class SignatureExtractor():
             logging.error(f"Error processing file {filename}: {e}")
             raise
 
+    def _get_lexer(self, filename):
+        """
+        Returns the lexer for a file, resolving each extension with pygments only once.
+        """
+        ext = os.path.splitext(filename)[1]
+        key = ext or os.path.basename(filename)
+        lexer = self._lexer_cache.get(key)
+        if lexer is None:
+            try:
+                lexer = get_lexer_for_filename('x' + ext if ext else key)
+            except ClassNotFound:
+                # Fallback to text lexer if file type not recognized
+                logging.error(f"Warning: Could not determine lexer for '{filename}', using text")
+                lexer = get_lexer_by_name('text')
+            self._lexer_cache[key] = lexer
+        return lexer
+
 
 # Example usage and testing
 if __name__ == '__main__':
 
     def main():
         """
-        Main function to process a file and output Markdown formatted code.
-        Usage: python markdown_formatter.py <filename> [options]
+        Main function to process a file and output its signatures.
+        Usage: python signature_extractor_pygments.py <filename>
         """
-        # if len(sys.argv) < 2:
-        #     print("Usage: python markdown_formatter.py <filename> [--style=emphasis|callout|heading] [--linenos] [--full]")
-        #     print("Example: python markdown_formatter.py example.py --style=callout --linenos")
-        #     return
-        #
-        # filename = sys.argv[1]
-        filename = "/Users/csimoes/Projects/Python/conductor/app/processor/base_processor.py"
-        # filename = "/Users/csimoes/Projects/Python/tldr/tempReact/react/packages/react/src/ReactAct.js"
+        if len(sys.argv) < 2:
+            print("Usage: python signature_extractor_pygments.py <filename>")
+            return
+
+        filename = sys.argv[1]
         a = SignatureExtractor()
         signatures = a.get_signatures(filename)
         logging.info(f"Extracted signatures: {signatures}")
@@ -11,83 +11,141 @@ Usage:
 import os
 import sys
 import logging
+import argparse
 import json
 import tempfile
-import shutil
-from datetime import datetime
-from pathlib import Path
+import itertools
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from .signature_extractor_pygments import SignatureExtractor
+from .result_cache import ResultCache, DEFAULT_CACHE_PATH
 from pygments_tldr.lexers import get_lexer_for_filename
 from pygments_tldr.util import ClassNotFound
-from .llm_providers import LLMFactory, LLMConfig
+
+try:
+    import orjson  # Optional C JSON encoder, much faster for large outputs
+except ImportError:
+    orjson = None
+
+# Format of the last_updated/last_scanned timestamps (always UTC)
+TIMESTAMP_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
+
+# Default number of files processed concurrently (signature extraction + optional LLM summary)
+MAX_WORKERS = 8
+
+# Default cap on the file content sent to the LLM for a summary; the signatures already cover the API
+MAX_SUMMARY_CONTENT_BYTES = 16384
+
+# Default size limit for scanned files; larger ones are usually generated or vendored
+MAX_FILE_SIZE_BYTES = 1_000_000
+
+# Bytes read from the start of a file to decide whether it is binary
+BINARY_CHECK_BYTES = 8192
+
+# Outstanding pool tasks allowed per worker before more directories are queued
+PENDING_TASKS_PER_WORKER = 4
+
+# Number of files summarized together in one LLM request
+SUMMARY_BATCH_SIZE = 16
+
+# Line prefixes handled by _parse_signatures
+_COMMENT_PREFIXES = ('#', '//')
+_BULLET_PREFIXES = ('- ', '* ')
 
 class TLDRFileCreator:
+    # Please see _is_programming_file for details on how we determine programming files
+    # excluded_lexers is a secondary check after file extension check
+    # Common programming file extensions
+    programming_extensions = frozenset({
+        '.py', '.pyx', '.pyi',  # Python
+        '.js', '.jsx', '.ts', '.tsx', '.mjs', '.cjs',  # JavaScript/TypeScript
+        '.java', '.kt', '.kts',  # Java/Kotlin
+        '.c', '.h', '.cpp', '.hpp', '.cc', '.cxx', '.c++',  # C/C++
+        '.cs', '.vb',  # C#/VB.NET
+        '.php', '.php3', '.php4', '.php5', '.phtml',  # PHP
+        '.rb', '.rbw',  # Ruby
+        '.go',  # Go
+        '.rs',  # Rust
+        '.swift',  # Swift
+        '.m', '.mm',  # Objective-C
+        '.scala', '.sc',  # Scala
+        '.pl', '.pm', '.pod',  # Perl
+        '.sh', '.bash', '.zsh', '.fish',  # Shell scripts
+        '.ps1', '.psm1', '.psd1',  # PowerShell
+        '.r', '.R',  # R
+        '.matlab', '.m',  # MATLAB
+        '.lua',  # Lua
+        '.dart',  # Dart
+        '.ex', '.exs',  # Elixir
+        '.erl', '.hrl',  # Erlang
+        '.hs', '.lhs',  # Haskell
+        '.clj', '.cljs', '.cljc',  # Clojure
+        '.fs', '.fsx', '.fsi',  # F#
+        '.ml', '.mli',  # OCaml
+        '.pas', '.pp', '.inc',  # Pascal
+        '.ada', '.adb', '.ads',  # Ada
+        '.d',  # D
+        '.nim',  # Nim
+        '.crystal', '.cr',  # Crystal
+        '.zig',  # Zig
+        '.v',  # V
+        '.jl',  # Julia
+        '.groovy', '.gvy', '.gy', '.gsh',  # Groovy
+    })
+
+    # Subset of programming_extensions whose Pygments lexer is always a programming language,
+    # accepted without a lexer lookup
+    known_programming_extensions = frozenset({
+        '.py', '.pyi', '.pyx', '.js', '.jsx', '.ts', '.tsx', '.mjs', '.cjs',
+        '.java', '.kt', '.kts', '.c', '.h', '.cpp', '.hpp', '.cc', '.cxx', '.cs',
+        '.php', '.rb', '.go', '.rs', '.swift', '.scala', '.lua', '.sh', '.bash', '.zsh',
+        '.dart', '.ex', '.exs', '.erl', '.hs', '.clj', '.ml', '.mli', '.jl', '.groovy', '.zig',
+    })
+
+    # Lexers to exclude (non-programming languages)
+    excluded_lexers = frozenset({
+        'TextLexer',           # Plain text
+        'MarkdownLexer',       # Markdown
+        'RstLexer',           # reStructuredText
+        'IniLexer',           # INI/config files
+        'YamlLexer',          # YAML
+        'JsonLexer',          # JSON (data format)
+        'XmlLexer',           # XML (markup)
+        'HtmlLexer',          # HTML (markup)
+        'CssLexer',           # CSS (styling, not programming logic)
+        'DiffLexer',          # Diff files
+        'LogsLexer',          # Log files
+    })
+
     def __init__(self, llm_provider: str = None, skip_file_summary: bool = True,
-                 terse_output: bool = False, local: bool = True, github_url: str = None):
+                 terse_output: bool = False, local: bool = True, github_url: str = None,
+                 concurrency: int = MAX_WORKERS, max_content_bytes: int = MAX_SUMMARY_CONTENT_BYTES,
+                 use_cache: bool = False, cache_path: str = None, max_file_size: int = MAX_FILE_SIZE_BYTES,
+                 durable_writes: bool = False):
         if llm_provider is None and not skip_file_summary:
             raise ValueError("llm_provider must be specified when initializing TLDRFileCreator (unless skip_file_summary=True)")
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
             
         self.signature_extractor = SignatureExtractor()
+        self._thread_local = threading.local()  # Per-worker extractors, see _extractor
         self.llm_provider = None
         self.skip_file_summary = skip_file_summary
         self.terse_output = terse_output
         self.local = local  # Whether we are processing local files or GitHub URLs
         self.github_url = github_url  # Optional GitHub URL for adding to tldr file as "root_directory"
+        self.concurrency = concurrency  # Number of files processed in parallel
+        self.max_content_bytes = max_content_bytes  # Cap on file content included in summary prompts
+        self.max_file_size = max_file_size  # Files larger than this are skipped (None for no limit)
+        self.durable_writes = durable_writes  # fsync the output before renaming it into place
+        # Optional on-disk cache of signatures and summaries keyed by file content
+        self.result_cache = ResultCache(cache_path or DEFAULT_CACHE_PATH) if use_cache else None
+        self._summary_id = None  # See _summary_cache_id
 
-        # Please see _is_programming_file for details on how we determine programming files
-        # excluded_lexers is a secondary check after file extension check
-        # Common programming file extensions
-        self.programming_extensions = {
-            '.py', '.pyx', '.pyi',  # Python
-            '.js', '.jsx', '.ts', '.tsx', '.mjs', '.cjs',  # JavaScript/TypeScript
-            '.java', '.kt', '.kts',  # Java/Kotlin
-            '.c', '.h', '.cpp', '.hpp', '.cc', '.cxx', '.c++',  # C/C++
-            '.cs', '.vb',  # C#/VB.NET
-            '.php', '.php3', '.php4', '.php5', '.phtml',  # PHP
-            '.rb', '.rbw',  # Ruby
-            '.go',  # Go
-            '.rs',  # Rust
-            '.swift',  # Swift
-            '.m', '.mm',  # Objective-C
-            '.scala', '.sc',  # Scala
-            '.pl', '.pm', '.pod',  # Perl
-            '.sh', '.bash', '.zsh', '.fish',  # Shell scripts
-            '.ps1', '.psm1', '.psd1',  # PowerShell
-            '.r', '.R',  # R
-            '.matlab', '.m',  # MATLAB
-            '.lua',  # Lua
-            '.dart',  # Dart
-            '.ex', '.exs',  # Elixir
-            '.erl', '.hrl',  # Erlang
-            '.hs', '.lhs',  # Haskell
-            '.clj', '.cljs', '.cljc',  # Clojure
-            '.fs', '.fsx', '.fsi',  # F#
-            '.ml', '.mli',  # OCaml
-            '.pas', '.pp', '.inc',  # Pascal
-            '.ada', '.adb', '.ads',  # Ada
-            '.d',  # D
-            '.nim',  # Nim
-            '.crystal', '.cr',  # Crystal
-            '.zig',  # Zig
-            '.v',  # V
-            '.jl',  # Julia
-            '.groovy', '.gvy', '.gy', '.gsh',  # Groovy
-        }
-
-        # Lexers to exclude (non-programming languages)
-        self.excluded_lexers = {
-            'TextLexer',           # Plain text
-            'MarkdownLexer',       # Markdown
-            'RstLexer',           # reStructuredText
-            'IniLexer',           # INI/config files
-            'YamlLexer',          # YAML
-            'JsonLexer',          # JSON (data format)
-            'XmlLexer',           # XML (markup)
-            'HtmlLexer',          # HTML (markup)
-            'CssLexer',           # CSS (styling, not programming logic)
-            'DiffLexer',          # Diff files
-            'LogsLexer',          # Log files
-        }
+        # Result of the lexer check per (lowercased) extension, see _is_programming_file
+        self._ext_cache = {}
         
         if not skip_file_summary:
             self._setup_llm_provider(llm_provider)
@@ -110,11 +168,28 @@ class TLDRFileCreator:
         if output_filename is None:
             output_filename = os.path.join(directory_path, 'tldr.json')
         
+        # One UTC timestamp for the whole run
+        timestamp = datetime.now(timezone.utc).strftime(TIMESTAMP_FORMAT)
+        
         # Process each directory in recursive mode
-        self._process_directories_recursively(directory_path, output_filename)
+        self._process_directories_recursively(directory_path, output_filename, timestamp)
         return output_filename
 
-    def _process_directories_recursively(self, root_directory, base_output_filename):
+    def close(self):
+        """Closes the result cache and the LLM provider, if any"""
+        if self.result_cache is not None:
+            self.result_cache.close()
+            self.result_cache = None
+        if self.llm_provider is not None:
+            self.llm_provider.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _process_directories_recursively(self, root_directory, base_output_filename, timestamp=None):
         """
         Process directories recursively, creating one large TLDR file in the base directory
         with information for all directories that contain programming files.
@@ -122,49 +197,60 @@ class TLDRFileCreator:
         Args:
             root_directory (str): Root directory to start from
             base_output_filename (str): Base output filename (used for the single output file)
+            timestamp (str): Scan timestamp of the run (optional, defaults to now)
         """
         processed_count = 0
-        all_directories = []
         abs_root_directory = os.path.abspath(root_directory)
         
-        # Walk through all directories
-        for root, dirs, filenames in os.walk(root_directory):
-            # Filter out hidden directories from dirs list to prevent os.walk from traversing them
-            dirs[:] = [d for d in dirs if not d.startswith('.')]
-            
+        # Current timestamp unless the caller already took one for the whole run
+        if timestamp is None:
+            timestamp = datetime.now(timezone.utc).strftime(TIMESTAMP_FORMAT)
+        
+        # Every walked path starts with this prefix, so relative paths are a plain slice
+        root_prefix = abs_root_directory if abs_root_directory.endswith(os.sep) else abs_root_directory + os.sep
+        
+        # Walk through all directories first (walking the absolute root keeps every path absolute)
+        dirs_with_files = []
+        for root, entries in self._scandir_walk(abs_root_directory):
             # Check if this directory has any programming files
             programming_files = []
-            for filename in filenames:
+            for entry in entries:
                 # Skip hidden files and temporary files
-                if filename.startswith('.') or filename.endswith('.tmp'):
+                if entry.name.startswith('.') or entry.name.endswith('.tmp'):
                     continue
-                item_path = os.path.join(root, filename)
-                if self._is_programming_file(item_path):
-                    programming_files.append(item_path)
+                if not self._is_programming_file(entry.name):
+                    continue
+                # Content checks come last, so only files with a programming extension cost a stat/read
+                if self.max_file_size is not None:
+                    try:
+                        file_size = entry.stat().st_size
+                    except OSError as e:
+                        # Broken symlinks and files removed mid-walk are skipped like unreadable files
+                        logging.warning(f"Could not stat {entry.path}: {e}")
+                        continue
+                    if file_size > self.max_file_size:
+                        logging.debug(f"Excluding file {entry.path} (larger than {self.max_file_size} bytes)")
+                        continue
+                if self._looks_binary(entry.path):
+                    logging.debug(f"Excluding file {entry.path} (binary content)")
+                    continue
+                programming_files.append(entry.path)
             
             # Only process directory if it has programming files
             if programming_files:
                 # Sort files for consistent output
                 programming_files.sort()
-                
-                # Generate the JSON content for this directory using relative paths
-                abs_directory_path = os.path.abspath(root)
-                directory_content = self._generate_json_content(abs_directory_path, programming_files, abs_root_directory)
-                all_directories.append(directory_content)
-                
-                # print(f"Processed directory: {abs_directory_path}")
-                processed_count += 1
+                rel_directory_path = root[len(root_prefix):] if root != abs_root_directory else '.'
+                dirs_with_files.append((rel_directory_path, programming_files))
         
         # Create the combined JSON structure
-        if all_directories:
+        if dirs_with_files:
             # Set default output filename if not provided
             if base_output_filename is None:
                 output_filename = 'tldr_combined.json'
             else:
                 output_filename = base_output_filename
 
-            timestamp = datetime.now().strftime('%Y-%m-%dT%H:%M:%SZ')
-
             # For GitHub repos we don't have a root directory
             if not self.local:
                 if self.github_url is not None:
@@ -172,97 +258,345 @@ class TLDRFileCreator:
                 else:
                     abs_root_directory = "GitHub Repository (unknown URL)"
 
-            combined_content = {
+            combined_header = {
                 # "root_directory": abs_root_directory,
                 "last_updated": timestamp,
                 # "total_directories_processed": processed_count,
-                "directories": all_directories
             }
             
-            # Write the combined file atomically
-            self._write_json_atomically(combined_content, output_filename)
+            # Queue the files of every directory on one shared pool so work from different
+            # directories overlaps; the pool size also caps outstanding LLM requests
+            with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+                # Directories come back in walk order and are streamed to the output as soon
+                # as each is complete instead of keeping them all
+                directories = self._iter_directory_contents(executor, dirs_with_files, timestamp)
+                try:
+                    # Write the combined file atomically
+                    self._write_atomically(self._iter_combined_json(combined_header, directories), output_filename)
+                finally:
+                    # A failed write leaves the generator suspended (and alive in the traceback);
+                    # closing it here cancels the queued files before the pool waits for them
+                    directories.close()
             
+            processed_count = len(dirs_with_files)
             # print(f"Combined TLDR file created: {output_filename}")
         
         logging.debug(f"Recursive processing complete. Processed {processed_count} directories into one file.")
         
-    def _generate_json_content(self, directory_path, files, root_directory=None):
+    def _scandir_walk(self, root_directory):
+        """
+        Walk a directory tree top-down with os.scandir, skipping hidden directories.
+        
+        DirEntry objects carry the file type from the directory listing, so no extra
+        stat calls are needed to tell files from directories.
+        
+        Args:
+            root_directory (str): Directory to start from
+            
+        Yields:
+            tuple: (directory path, list of os.DirEntry for the files in that directory)
+        """
+        stack = [root_directory]
+        while stack:
+            directory = stack.pop()
+            file_entries = []
+            subdirectories = []
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        try:
+                            # Symlinked directories are not followed, matching os.walk
+                            if entry.is_dir(follow_symlinks=False):
+                                if not entry.name.startswith('.'):
+                                    subdirectories.append(entry.path)
+                            elif entry.is_file():
+                                file_entries.append(entry)
+                        except OSError:
+                            continue
+            except OSError as e:
+                logging.debug(f"Skipping unreadable directory {directory}: {e}")
+                continue
+            
+            yield directory, file_entries
+            
+            # Reverse-sorted so subdirectories are popped in name order
+            subdirectories.sort(reverse=True)
+            stack.extend(subdirectories)
+
+    def _iter_directory_contents(self, executor, dirs_with_files, timestamp):
+        """
+        Processes directories on the shared pool and yields their JSON content in walk order.
+        
+        Directories are queued only while fewer than PENDING_TASKS_PER_WORKER tasks per worker
+        are outstanding, so finished directories waiting behind a slow one stay bounded. If
+        anything fails (or the caller stops early) the queued work that has not started yet
+        is cancelled, so no further files are processed or summarized.
+        
+        Args:
+            executor (ThreadPoolExecutor): Pool to run the work on
+            dirs_with_files (list): (relative directory path, sorted file paths) in walk order
+            timestamp (str): Scan timestamp to record for each file
+            
+        Yields:
+            dict: JSON content of each directory
+        """
+        max_pending_tasks = self.concurrency * PENDING_TASKS_PER_WORKER
+        remaining = iter(dirs_with_files)
+        pending = deque()  # (relative directory path, futures) in walk order
+        pending_tasks = 0
+        try:
+            while True:
+                # Keep enough work queued to occupy every worker, but not the whole tree
+                while pending_tasks < max_pending_tasks:
+                    next_directory = next(remaining, None)
+                    if next_directory is None:
+                        break
+                    rel_directory_path, files = next_directory
+                    futures = self._submit_files(executor, files, timestamp)
+                    pending.append((rel_directory_path, futures))
+                    pending_tasks += len(futures)
+                
+                if not pending:
+                    return
+                
+                # Wait for the oldest directory; it stays in pending until it is built, so a
+                # failure in it also cancels its own remaining files
+                rel_directory_path, futures = pending[0]
+                file_results = itertools.chain.from_iterable(future.result() for future in futures)
+                directory_content = self._build_directory_content(rel_directory_path, file_results)
+                pending.popleft()
+                pending_tasks -= len(futures)
+                yield directory_content
+        finally:
+            # Tasks already running finish, but nothing still queued is started
+            for _, futures in pending:
+                for future in futures:
+                    future.cancel()
+
+    def _submit_files(self, executor, files, timestamp):
         """
-        Generates the JSON content for the TLDR file.
+        Queues one directory's files on the executor.
+        
+        With summaries enabled the files are queued in groups of SUMMARY_BATCH_SIZE so each
+        group needs a single LLM request; otherwise every file is a task of its own.
         
         Args:
-            directory_path (str): Absolute path to the directory
-            files (list): List of file paths to process
-            root_directory (str): Root directory for calculating relative paths (optional)
+            executor (ThreadPoolExecutor): Pool to run the work on
+            files (list): Sorted file paths of the directory
+            timestamp (str): Scan timestamp to record for each file
             
         Returns:
-            dict: Generated JSON content
+            list: Futures in input order, each resolving to the list of results for its files
         """
-        # Current timestamp
-        timestamp = datetime.now().strftime('%Y-%m-%dT%H:%M:%SZ')
+        if self.skip_file_summary or not self.llm_provider:
+            return [executor.submit(self._process_files, [file_path], timestamp) for file_path in files]
         
-        # Calculate relative directory path if root_directory is provided
-        if root_directory:
-            rel_directory_path = os.path.relpath(directory_path, root_directory)
-            # Use '.' for the root directory itself
-            if rel_directory_path == '.':
-                rel_directory_path = '.'
-        else:
-            rel_directory_path = directory_path
+        return [
+            executor.submit(self._process_file_batch, files[i:i + SUMMARY_BATCH_SIZE], timestamp)
+            for i in range(0, len(files), SUMMARY_BATCH_SIZE)
+        ]
+
+    def _build_directory_content(self, rel_directory_path, file_results):
+        """
+        Builds the JSON content for one directory from its processed files.
         
+        Args:
+            rel_directory_path (str): Directory path relative to the scanned root ('.' for the root)
+            file_results (iterable): Results of _process_file, in output order (None entries are skipped)
+            
+        Returns:
+            dict: Generated JSON content
+        """
         # Start building the JSON structure
         json_data = {
             "directory_path": rel_directory_path,
-            "files": []
+            "files": [file_data for file_data in file_results if file_data is not None]
         }
+
+        return json_data
+
+    def _process_files(self, file_paths, timestamp):
+        """
+        Processes files one at a time; the unit of work when summaries are not batched.
         
-        # Process each file
-        for file_path in files:
-            # Calculate relative file path if root_directory is provided
-            abs_file_path = os.path.abspath(file_path)
-            if root_directory:
-                rel_file_path = os.path.relpath(abs_file_path, root_directory)
-            else:
-                rel_file_path = abs_file_path
+        Args:
+            file_paths (list): Paths of the files to process
+            timestamp (str): Scan timestamp to record for the files
+            
+        Returns:
+            list: Result of _process_file for each file
+        """
+        return [self._process_file(file_path, timestamp) for file_path in file_paths]
+
+    def _process_file(self, file_path, timestamp):
+        """
+        Extracts signatures (and optionally an LLM summary) for a single file.
+        
+        Args:
+            file_path (str): Path to the file to process
+            timestamp (str): Scan timestamp to record for the file
+            
+        Returns:
+            dict: File entry for the JSON content, or None if the file is skipped
+        """
+        extracted = self._extract_file(file_path, timestamp)
+        if extracted is None:
+            return None
+        file_data, signatures_text, file_content, cache_key = extracted
+        
+        # Generate AI-powered summary if LLM provider is available and not skipped
+        if not self.skip_file_summary:
+            summary = self._cached_summary(cache_key)
+            if summary is None:
+                logging.debug(f"Generating file summary from LLM for {file_path}")
+                summary = self._generate_file_summary(file_path, signatures_text, file_content)
+                self._store_summary(cache_key, summary)
+            file_data["summary"] = summary
+        else:
+            logging.debug(f"Skipping file summary generation for {file_path}")
+        
+        return file_data
+
+    def _process_file_batch(self, file_paths, timestamp):
+        """
+        Extracts signatures for a group of files and summarizes them with one LLM request.
+        
+        Args:
+            file_paths (list): Paths of the files to process
+            timestamp (str): Scan timestamp to record for the files
             
-            # Extract signatures using signature_extractor
+        Returns:
+            list: File entry for each file, or None for files that are skipped
+        """
+        extracted = [self._extract_file(file_path, timestamp) for file_path in file_paths]
+        
+        # Summaries of unchanged files come from the cache, the rest share one request
+        summaries = {}
+        items = []
+        item_cache_keys = []
+        for file_path, entry in zip(file_paths, extracted):
+            if entry is None:
+                continue
+            summary = self._cached_summary(entry[3])
+            if summary is not None:
+                summaries[file_path] = summary
+            else:
+                items.append((file_path, self._summary_content(file_path, entry[2]), entry[1]))
+                item_cache_keys.append(entry[3])
+        
+        if items:
+            logging.debug(f"Generating file summaries from LLM for {len(items)} files")
             try:
-                signatures_text = self.signature_extractor.get_signatures(file_path)
-                signatures_list = self._parse_signatures(signatures_text)
+                generated = self.llm_provider.generate_summaries_batch(items)
             except Exception as e:
-                logging.warning(f"Could not extract signatures from {file_path}: {e}")
-                signatures_list = [f"Error extracting signatures: {e}"]
+                logging.error(f"Failed to generate summaries for {len(items)} files: {e}")
                 raise
-
-            # Skip files with 0 signatures if terse_output is enabled
-            if self.terse_output and len(signatures_list) == 0:
-                logging.debug(f"Skipping file {file_path} (0 signatures, terse_output enabled)")
+            for (file_path, _, _), cache_key in zip(items, item_cache_keys):
+                self._store_summary(cache_key, generated[file_path])
+            summaries.update(generated)
+        
+        results = []
+        for file_path, entry in zip(file_paths, extracted):
+            if entry is None:
+                results.append(None)
                 continue
+            file_data = entry[0]
+            file_data["summary"] = summaries[file_path]
+            results.append(file_data)
+        return results
 
-            file_data = {
-                "file_name": os.path.basename(file_path),
-                "last_scanned": timestamp,
-                "signatures": signatures_list
-            }
+    def _extract_file(self, file_path, timestamp):
+        """
+        Extracts signatures for a single file and builds its entry without a summary.
+        
+        Args:
+            file_path (str): Path to the file to process
+            timestamp (str): Scan timestamp to record for the file
             
-            # Generate AI-powered summary if LLM provider is available and not skipped
-            if not self.skip_file_summary:
-                logging.debug(f"Generating file summary from LLM for {file_path}")
-                summary = self._generate_file_summary(file_path, signatures_text)
-                file_data["summary"] = summary
+        Returns:
+            tuple: (file entry, raw signatures text, file content, cache key or None),
+                or None if the file is skipped
+        """
+        # Extract signatures using signature_extractor
+        try:
+            if self.result_cache is None:
+                signatures_text, file_content = self._extractor().get_signatures_with_content(file_path)
+                cache_key = None
             else:
-                logging.debug(f"Skipping file summary generation for {file_path}")
+                signatures_text, file_content, cache_key = self._extract_signatures_cached(file_path)
+            signatures_list = self._parse_signatures(signatures_text)
+        except Exception as e:
+            logging.warning(f"Could not extract signatures from {file_path}: {e}")
+            signatures_list = [f"Error extracting signatures: {e}"]
+            raise
+
+        # Skip files with 0 signatures if terse_output is enabled
+        if self.terse_output and len(signatures_list) == 0:
+            logging.debug(f"Skipping file {file_path} (0 signatures, terse_output enabled)")
+            return None
+
+        file_data = {
+            "file_name": os.path.basename(file_path),
+            "last_scanned": timestamp,
+            "signatures": signatures_list
+        }
+        
+        return file_data, signatures_text, file_content, cache_key
+
+    def _extract_signatures_cached(self, file_path):
+        """
+        Reads a file once and returns its signatures, extracting them only on a cache miss.
+        
+        Args:
+            file_path (str): Path to the file to process
             
-            json_data["files"].append(file_data)
+        Returns:
+            tuple: (raw signatures text, file content, cache key)
+        """
+        with open(file_path, 'rb') as f:
+            data = f.read()
+        cache_key = ResultCache.key_for(file_path, data)
+        # Universal newlines, as read_text applies on the uncached path
+        file_content = data.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+        
+        signatures_text = self.result_cache.get_signatures(cache_key)
+        if signatures_text is None:
+            signatures_text = self._extractor().get_signatures_from_code(file_path, file_content)
+            self.result_cache.put_signatures(cache_key, signatures_text)
+        else:
+            logging.debug(f"Using cached signatures for {file_path}")
+        return signatures_text, file_content, cache_key
 
-        return json_data
+    def _extractor(self):
+        """Returns this thread's SignatureExtractor, so workers never share lexer state or caches"""
+        extractor = getattr(self._thread_local, 'extractor', None)
+        if extractor is None:
+            extractor = self._thread_local.extractor = SignatureExtractor()
+        return extractor
+
+    def _summary_cache_id(self):
+        """Returns what cached summaries must match: the provider's model and prompts, and the content limit"""
+        if self._summary_id is None:
+            self._summary_id = f"{self.llm_provider.summary_cache_id()}:{self.max_content_bytes}"
+        return self._summary_id
+
+    def _cached_summary(self, cache_key):
+        """Returns the cached LLM summary for a file, or None if there is none for the current settings"""
+        if cache_key is None or not self.llm_provider:
+            return None
+        return self.result_cache.get_summary(cache_key, self._summary_cache_id())
+
+    def _store_summary(self, cache_key, summary):
+        """Caches an LLM summary for a file (placeholder summaries without a provider are not cached)"""
+        if cache_key is not None and self.llm_provider:
+            self.result_cache.put_summary(cache_key, self._summary_cache_id(), summary)
 
     def _is_programming_file(self, file_path):
         """
         Check if file has a known programming extension and is recognized by Pygments.
         
         Args:
-            file_path (str): Path to the file to check
+            file_path (str): Name or path of the file to check (only the extension is used)
             
         Returns:
             bool: True if file is a programming language, False otherwise
@@ -276,30 +610,61 @@ class TLDRFileCreator:
             logging.debug(f"Excluding file {file_path} (unknown programming extension: {ext})")
             return False
         
+        # Common languages need no lexer lookup at all
+        if ext in self.known_programming_extensions:
+            return True
+        
+        # The lexer only depends on the extension, so Pygments is asked once per extension
+        if ext in self._ext_cache:
+            return self._ext_cache[ext]
+        
         try:
             lexer = get_lexer_for_filename(file_path)
             lexer_name = lexer.__class__.__name__
             
             # Check if lexer is in our excluded list
             if lexer_name in self.excluded_lexers:
-                logging.debug(f"Excluding file {file_path} (lexer: {lexer_name})")
-                return False
-                
-            logging.debug(f"Including file {file_path} (lexer: {lexer_name})")
-            return True
+                logging.debug(f"Excluding files with extension {ext} (lexer: {lexer_name})")
+                is_programming = False
+            else:
+                logging.debug(f"Including files with extension {ext} (lexer: {lexer_name})")
+                is_programming = True
             
         except ClassNotFound:
             # If Pygments can't determine the file type, exclude it
-            logging.debug(f"Excluding file {file_path} (unknown file type)")
-            return False
+            logging.debug(f"Excluding files with extension {ext} (unknown file type)")
+            is_programming = False
         except Exception as e:
             # If there's any other error, exclude the file but log the issue
             logging.warning(f"Error analyzing file {file_path}: {e}")
             raise
             # return False
+        
+        self._ext_cache[ext] = is_programming
+        return is_programming
+
+    def _looks_binary(self, file_path):
+        """
+        Check whether a file looks binary, i.e. has a NUL byte near its start.
+        
+        Args:
+            file_path (str): Path to the file to check
+            
+        Returns:
+            bool: True if the file appears to be binary (or cannot be read), False otherwise
+        """
+        try:
+            with open(file_path, 'rb') as f:
+                return b'\x00' in f.read(BINARY_CHECK_BYTES)
+        except OSError as e:
+            logging.warning(f"Could not read {file_path}: {e}")
+            return True
 
     def _setup_llm_provider(self, provider_name: str):
         """Setup LLM provider for generating summaries"""
+        # Deferred so the provider SDKs are only imported when summaries are requested
+        from .llm_providers import LLMFactory, LLMConfig
+        
         try:
             config = LLMConfig.from_env(provider_name)
             self.llm_provider = LLMFactory.create_provider(
@@ -313,15 +678,13 @@ class TLDRFileCreator:
             self.llm_provider = None
             raise
 
-    def _generate_file_summary(self, file_path: str, signatures: str) -> str:
-        """Generate AI-powered file summary"""
+    def _generate_file_summary(self, file_path: str, signatures: str, file_content: str = None) -> str:
+        """Generate AI-powered file summary from the signatures and the first max_content_bytes of the file (read from disk if not given)"""
         if not self.llm_provider:
             return "Summary of what the file does goes here.\nNeeds to be less than 500 characters."
         
         try:
-            # Read file content
-            with open(file_path, 'r', encoding='utf-8') as f:
-                file_content = f.read()
+            file_content = self._summary_content(file_path, file_content)
             
             # Generate summary using LLM
             response = self.llm_provider.generate_summary(file_path, file_content, signatures)
@@ -331,6 +694,26 @@ class TLDRFileCreator:
             logging.error(f"Failed to generate summary for {file_path}: {e}")
             raise
 
+    def _summary_content(self, file_path: str, file_content: str = None) -> str:
+        """
+        Returns the first max_content_bytes of a file for a summary prompt.
+        
+        Args:
+            file_path (str): Path to the file, read only if file_content is not given
+            file_content (str): Full file content if already read (optional)
+            
+        Returns:
+            str: File content, cut on a UTF-8 boundary (a partial character at the end is dropped)
+        """
+        if file_content is None:
+            with open(file_path, 'rb') as f:
+                return f.read(self.max_content_bytes).decode('utf-8', errors='ignore')
+        
+        # No character is longer than 4 bytes, so short content never needs encoding
+        if len(file_content) > self.max_content_bytes // 4:
+            file_content = file_content.encode('utf-8')[:self.max_content_bytes].decode('utf-8', errors='ignore')
+        return file_content
+
     def _parse_signatures(self, signatures_text: str) -> list:
         """
         Parse signatures text into a list of individual signatures.
@@ -341,39 +724,74 @@ class TLDRFileCreator:
         Returns:
             list: List of individual signatures
         """
-        if not signatures_text or not signatures_text.strip():
+        if not signatures_text:
             return []
         
-        # Split by lines and clean up
-        lines = signatures_text.strip().split('\n')
+        # Single pass over the lines; locals avoid repeated attribute lookups
         signatures = []
-        
-        for line in lines:
+        append = signatures.append
+        for line in signatures_text.splitlines():
             line = line.strip()
-            if line and not line.startswith('#') and not line.startswith('//'):
-                # Remove markdown formatting if present
-                if line.startswith('- '):
-                    line = line[2:]
-                elif line.startswith('* '):
-                    line = line[2:]
-                
-                # Remove code block markers if present
-                if line.startswith('```') or line.endswith('```'):
-                    continue
-                    
-                signatures.append(line)
+            if not line or line.startswith(_COMMENT_PREFIXES):
+                continue
+            
+            # Remove markdown formatting if present
+            if line.startswith(_BULLET_PREFIXES):
+                line = line[2:]
+            
+            # Remove code block markers if present
+            if line.startswith('```') or line.endswith('```'):
+                continue
+            
+            append(line)
         
         return signatures
 
-    def _write_json_atomically(self, content: dict, output_filename: str):
+    def _iter_combined_json(self, header: dict, directories):
         """
-        Write JSON content atomically using temporary file and move operation.
+        Encode the combined TLDR document one directory at a time.
+        
+        The output is byte-for-byte what json.dumps(indent=2) produces for
+        {**header, "directories": [...]}, but only one directory is encoded at a time.
+        
+        Args:
+            header (dict): Top-level fields written before the directories
+            directories (iterable): Directory contents, consumed lazily
+            
+        Yields:
+            bytes: Consecutive chunks of the document
+        """
+        yield b'{\n'
+        for key, value in header.items():
+            yield b'  ' + self._encode_json(key) + b': ' + self._encode_json(value) + b',\n'
+        yield b'  "directories": ['
+        
+        separator = b'\n'
+        for directory_content in directories:
+            # Nest the entry two levels deep: every line of it gets four more spaces
+            yield separator + b'    ' + self._encode_json(directory_content).replace(b'\n', b'\n    ')
+            separator = b',\n'
+        
+        # An empty list is written as [] like json.dumps does
+        yield b'\n  ]\n}' if separator != b'\n' else b']\n}'
+
+    def _encode_json(self, value) -> bytes:
+        """Encode a value as two-space indented UTF-8 JSON, with orjson when it is installed"""
+        if orjson is not None:
+            return orjson.dumps(value, option=orjson.OPT_INDENT_2)
+        return json.dumps(value, indent=2, ensure_ascii=False).encode('utf-8')
+
+    def _write_atomically(self, chunks, output_filename: str):
+        """
+        Write bytes atomically using a temporary file and os.replace.
         
         This ensures that readers never see a partially written file, and the
-        operation is atomic on most filesystems.
+        operation is atomic on most filesystems. Unless durable_writes is set the data
+        is not fsynced, so a power failure right after the rename may lose the new file;
+        the output can simply be regenerated, so that is fine for this tool.
         
         Args:
-            content (dict): JSON content to write
+            chunks (iterable): Byte strings making up the file, consumed while writing
             output_filename (str): Final output file path
         """
         # Get directory for temporary file (same as target for atomic move)
@@ -387,37 +805,62 @@ class TLDRFileCreator:
         )
         
         try:
-            # Write to temporary file
-            with os.fdopen(temp_fd, 'w', encoding='utf-8') as f:
-                json.dump(content, f, indent=2, ensure_ascii=False)
-                f.flush()
-                os.fsync(f.fileno())  # Force write to disk
-            
-            # Atomic move (on most filesystems)
-            if os.name == 'nt':  # Windows
-                # Windows doesn't allow atomic replace of existing files
-                if os.path.exists(output_filename):
-                    os.unlink(output_filename)
-            
-            shutil.move(temp_path, output_filename)
+            with os.fdopen(temp_fd, 'wb') as f:
+                for chunk in chunks:
+                    f.write(chunk)
+                if self.durable_writes:
+                    f.flush()
+                    os.fsync(f.fileno())  # Force write to disk
+            
+            # Atomic rename over any existing file; the temp file is in the same directory,
+            # so this never crosses devices (os.replace also overwrites on Windows)
+            os.replace(temp_path, output_filename)
             logging.debug(f"Atomically wrote JSON to {output_filename}")
             
-        except Exception as e:
-            # Clean up temporary file if something goes wrong
+        except BaseException:
+            # Clean up the temporary file and let the original error through unchanged: with
+            # streamed chunks it usually comes from producing the content (signature extraction,
+            # LLM calls) rather than from the write itself
             try:
-                if os.path.exists(temp_path):
-                    os.unlink(temp_path)
-            except:
+                os.unlink(temp_path)
+            except OSError:
                 pass
-            raise Exception(f"Failed to write JSON file atomically: {e}")
+            raise
 
+def concurrency_arg(value: str) -> int:
+    """
+    Parses a --concurrency value for argparse.
+    
+    Args:
+        value (str): Number of files to process in parallel
+        
+    Returns:
+        int: The number of workers, at least 1
+    """
+    workers = int(value)
+    if workers < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return workers
+
+def max_file_size_arg(value: str):
+    """
+    Parses a --max-file-size value for argparse.
+    
+    Args:
+        value (str): Size limit in bytes, 0 for no limit
+        
+    Returns:
+        int: The size limit, or None for no limit
+    """
+    size = int(value)
+    if size < 0:
+        raise argparse.ArgumentTypeError(f"must be 0 (no limit) or a positive number of bytes, got {value}")
+    return size or None
 
 def main():
     """
     Main function to handle command line arguments and create TLDR file.
     """
-    import argparse
-    
     class CustomHelpFormatter(argparse.HelpFormatter):
         def format_help(self):
             help_text = super().format_help()
@@ -426,6 +869,7 @@ def main():
             llm_setup = "\n\nLLM PROVIDER SETUP:\n"
             llm_setup += "=" * 20 + "\n"
             
+            from .llm_providers import LLMConfig
             providers = LLMConfig.get_supported_providers()
             for provider, env_var in providers.items():
                 llm_setup += f"\nFor {provider.upper()}:\n"
@@ -445,6 +889,12 @@ def main():
     )
     parser.add_argument('directory_path', help='Path to the directory to scan (processed recursively)')
     parser.add_argument('output_filename', nargs='?', help='Optional output filename (defaults to tldr.json)')
+    parser.add_argument('--concurrency', type=concurrency_arg, default=MAX_WORKERS,
+                        help=f'Number of files to process in parallel (default: {MAX_WORKERS})')
+    parser.add_argument('--max-file-size', type=max_file_size_arg, default=MAX_FILE_SIZE_BYTES,
+                        help=f'Skip files larger than this many bytes, 0 for no limit (default: {MAX_FILE_SIZE_BYTES})')
+    parser.add_argument('--cache', action='store_true',
+                        help='Reuse signatures and summaries of unchanged files from ~/.cache/tldr/cache.sqlite')
     # parser.add_argument('--llm', choices=LLMFactory.available_providers(),
     #                    help='LLM provider to use for generating summaries')
     # parser.add_argument('--include-file-summary', action='store_true',
@@ -456,8 +906,9 @@ def main():
     # Default behavior is now recursive processing
     
     try:
-        creator = TLDRFileCreator()
-        output_filename = creator.create_tldr_file(args.directory_path, args.output_filename)
+        with TLDRFileCreator(concurrency=args.concurrency,
+                             use_cache=args.cache, max_file_size=args.max_file_size) as creator:
+            output_filename = creator.create_tldr_file(args.directory_path, args.output_filename)
         print(f"TLDR file created successfully: {output_filename}")
     except Exception as e:
         print(f"Error: {e}")
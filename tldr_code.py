@@ -21,7 +21,7 @@ from pathlib import Path
 from urllib.parse import urlparse
 
 from tldr.github_adapter import GitHubAdapter
-from tldr.tldr_file_creator import TLDRFileCreator
+from tldr.tldr_file_creator import TLDRFileCreator, MAX_WORKERS, MAX_FILE_SIZE_BYTES, concurrency_arg, max_file_size_arg
 
 def is_github_url(input_string: str) -> bool:
     """
@@ -48,7 +48,9 @@ def is_github_url(input_string: str) -> bool:
     except Exception:
         return False
 
-def process_github_url(github_url: str, github_temp_dir: str, output_filename: str = None, terse_output: bool = False) -> str:
+def process_github_url(github_url: str, github_temp_dir: str, output_filename: str = None, terse_output: bool = False,
+                       concurrency: int = MAX_WORKERS, use_cache: bool = False,
+                       max_file_size: int = MAX_FILE_SIZE_BYTES) -> str:
     """
     Process a GitHub URL to create a TLDR file.
     
@@ -56,6 +58,9 @@ def process_github_url(github_url: str, github_temp_dir: str, output_filename: s
         github_url (str): GitHub repository URL
         output_filename (str): Optional output filename
         terse_output (bool): Exclude files with 0 signatures
+        concurrency (int): Number of files to process in parallel
+        use_cache (bool): Reuse results for unchanged files from the on-disk cache
+        max_file_size (int): Skip files larger than this many bytes, None for no limit
         
     Returns:
         str: Path to the generated TLDR file
@@ -63,7 +68,8 @@ def process_github_url(github_url: str, github_temp_dir: str, output_filename: s
     """
     logging.info(f"Processing GitHub repository: {github_url}")
     
-    adapter = GitHubAdapter(terse_output=terse_output)
+    adapter = GitHubAdapter(terse_output=terse_output, concurrency=concurrency, use_cache=use_cache,
+                            max_file_size=max_file_size)
     
     # Determine output directory - use current directory if no specific output file given
     if github_temp_dir:
@@ -86,7 +92,9 @@ def process_github_url(github_url: str, github_temp_dir: str, output_filename: s
     
     return tldr_file
 
-def process_local_path(directory_path: str, output_filename: str = None, terse_output: bool = False) -> str:
+def process_local_path(directory_path: str, output_filename: str = None, terse_output: bool = False,
+                       concurrency: int = MAX_WORKERS, use_cache: bool = False,
+                       max_file_size: int = MAX_FILE_SIZE_BYTES) -> str:
     """
     Process a local directory path to create a TLDR file.
     
@@ -94,6 +102,9 @@ def process_local_path(directory_path: str, output_filename: str = None, terse_o
         directory_path (str): Local directory path
         output_filename (str): Optional output filename
         terse_output (bool): Exclude files with 0 signatures
+        concurrency (int): Number of files to process in parallel
+        use_cache (bool): Reuse results for unchanged files from the on-disk cache
+        max_file_size (int): Skip files larger than this many bytes, None for no limit
         
     Returns:
         str: Path to the generated TLDR file
@@ -106,13 +117,13 @@ def process_local_path(directory_path: str, output_filename: str = None, terse_o
     if not os.path.isdir(directory_path):
         raise ValueError(f"'{directory_path}' is not a directory.")
     
-    creator = TLDRFileCreator(terse_output=terse_output)
-    
     # Set default output filename if not provided
     if output_filename is None:
         output_filename = os.path.join(directory_path, 'tldr.json')
     
-    return creator.create_tldr_file(directory_path, output_filename)
+    with TLDRFileCreator(terse_output=terse_output, concurrency=concurrency, use_cache=use_cache,
+                         max_file_size=max_file_size) as creator:
+        return creator.create_tldr_file(directory_path, output_filename)
 
 def main():
     """
@@ -154,6 +165,23 @@ Examples:
         type=Path,
         help='location to store temporary files for GitHub repos (default: current directory), ignored if input is a local directory'
     )
+    parser.add_argument(
+        '--concurrency',
+        type=concurrency_arg,
+        default=MAX_WORKERS,
+        help=f'Number of files to process in parallel (default: {MAX_WORKERS})'
+    )
+    parser.add_argument(
+        '--cache',
+        action='store_true',
+        help='Reuse signatures and summaries of unchanged files from ~/.cache/tldr/cache.sqlite'
+    )
+    parser.add_argument(
+        '--max-file-size',
+        type=max_file_size_arg,
+        default=MAX_FILE_SIZE_BYTES,
+        help=f'Skip files larger than this many bytes, 0 for no limit (default: {MAX_FILE_SIZE_BYTES})'
+    )
 
     args = parser.parse_args()
     
@@ -166,10 +194,12 @@ Examples:
         logging.debug(f"args: {args}")
         # Detect input type and route accordingly
         if is_github_url(args.input):
-            tldr_file = process_github_url(args.input, args.github_temp_dir, args.output_filename, args.terse_output)
+            tldr_file = process_github_url(args.input, args.github_temp_dir, args.output_filename, args.terse_output,
+                                           args.concurrency, args.cache, args.max_file_size)
             logging.info(f"✓ GitHub repository processed successfully!")
         else:
-            tldr_file = process_local_path(args.input, args.output_filename, args.terse_output)
+            tldr_file = process_local_path(args.input, args.output_filename, args.terse_output, args.concurrency,
+                                           args.cache, args.max_file_size)
             logging.info(f"✓ Local directory processed successfully!")
         
         logging.info(f"TLDR file created: {tldr_file}")